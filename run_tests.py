@@ -11,6 +11,8 @@ The outputs must be deterministic (no timestamps, etc.) for comparison.
 """
 
 import argparse
+import hashlib
+import io
 import os
 import subprocess
 import sys
@@ -20,6 +22,9 @@ BUILD_DIR = Path("build")
 OUTPUT_DIR = Path("tests/output")
 REGRESSIONS_DIR = Path("tests/regressions")
 
+# Environment for Python test subprocesses, built once and shared by all runs
+PYTHON_TEST_ENV = {**os.environ, "PYTHONPATH": str(BUILD_DIR)}
+
 
 def coverage_wrap(name: str, args: list[str]) -> list[str]:
     """Wrap command with coverage if COVERAGE_RUN environment variable is set."""
@@ -71,65 +76,108 @@ PYTHON_TESTS = {
 }
 
 
-def run_cpp_test(name: str) -> tuple[str, str, int]:
+def run_subprocess(
+    cmd: list[str], env: dict[str, str] | None = None
+) -> tuple[bytes, str, int]:
+    """Run a command and return (stdout, stderr, returncode).
+
+    stdout is kept as raw bytes: it is written verbatim as the golden master
+    and compared byte-for-byte against the Python output.
+    """
+    # With close_fds off, CPython spawns the child via posix_spawn() instead
+    # of fork()+exec() on POSIX. The pipes it creates are close-on-exec anyway.
+    result = subprocess.run(
+        cmd, capture_output=True, env=env, close_fds=sys.platform == "win32"
+    )
+    # Decode with error handling for any binary data in output
+    stderr = result.stderr.decode("utf-8", errors="replace")
+    return result.stdout, stderr, result.returncode
+
+
+def run_cpp_test(name: str) -> tuple[bytes, str, int]:
     """Run a C++ test executable and return (stdout, stderr, returncode)."""
     exe = BUILD_DIR / name
     if sys.platform == "win32":
         exe = exe.with_suffix(".exe")
 
     if not exe.exists():
-        return "", f"Executable not found: {exe}", -1
-
-    result = subprocess.run(
-        [str(exe)],
-        capture_output=True,
-    )
-    # Decode with error handling for any binary data in output
-    try:
-        stdout = result.stdout.decode("utf-8")
-    except UnicodeDecodeError:
-        stdout = result.stdout.decode("utf-8", errors="replace")
-    try:
-        stderr = result.stderr.decode("utf-8")
-    except UnicodeDecodeError:
-        stderr = result.stderr.decode("utf-8", errors="replace")
+        return b"", f"Executable not found: {exe}", -1
 
-    return stdout, stderr, result.returncode
+    return run_subprocess([str(exe)])
 
 
-def run_python_test(script: Path) -> tuple[str, str, int]:
+def run_python_test(script: Path) -> tuple[bytes, str, int]:
     """Run a Python test script and return (stdout, stderr, returncode)."""
     if not script.exists():
-        return "", f"Python test not found: {script}", -1
+        return b"", f"Python test not found: {script}", -1
 
     # Build command with optional coverage wrapper
     cmd = coverage_wrap(script.stem, [str(script)])
 
-    result = subprocess.run(
-        [sys.executable] + cmd,
-        capture_output=True,
-        env={**os.environ, "PYTHONPATH": str(BUILD_DIR)},
-    )
-    try:
-        stdout = result.stdout.decode("utf-8")
-    except UnicodeDecodeError:
-        stdout = result.stdout.decode("utf-8", errors="replace")
-    try:
-        stderr = result.stderr.decode("utf-8")
-    except UnicodeDecodeError:
-        stderr = result.stderr.decode("utf-8", errors="replace")
+    return run_subprocess([sys.executable] + cmd, env=PYTHON_TEST_ENV)
 
-    return stdout, stderr, result.returncode
 
+def find_first_diff(a: bytes, b: bytes) -> int:
+    """Return the offset of the first byte where a and b differ.
 
-def save_output(name: str, stdout: str):
-    """Save test output to file (raw stdout only, no headers)."""
+    The common prefix is narrowed down by halving, so each step is a single
+    slice comparison instead of a line-by-line walk over the whole output.
+    If one input is a prefix of the other, the shorter length is returned.
+    """
+    lo, hi = 0, min(len(a), len(b))
+    while hi - lo > 4096:
+        mid = (lo + hi) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid
+    while lo < hi and a[lo] == b[lo]:
+        lo += 1
+    return lo
+
+
+def line_at(data: bytes, offset: int) -> str:
+    """Return the decoded line of data containing the byte at offset."""
+    start = data.rfind(b"\n", 0, offset) + 1
+    end = data.find(b"\n", offset)
+    if end == -1:
+        end = len(data)
+    return data[start:end].rstrip(b"\r").decode("utf-8", errors="replace")
+
+
+def save_output(name: str, stdout: bytes):
+    """Save test output to file (raw stdout only, no headers).
+
+    A `{name}.ll.sha` stamp records the digest, size and mtime of the last
+    written output. Unchanged golden masters are left untouched (mtime
+    included) only while the file on disk still matches that stamp; a file
+    edited or replaced outside the runner is compared byte for byte instead.
+    Writes go through a temporary file and `os.replace` so readers never see
+    a partially written file.
+    """
     output_file = OUTPUT_DIR / f"{name}.ll"
-    with open(output_file, "w") as f:
+    stamp_file = output_file.with_name(output_file.name + ".sha")
+    digest = hashlib.blake2b(stdout, digest_size=16).hexdigest()
+
+    def stamp_for(st: os.stat_result) -> str:
+        return f"{digest} {st.st_size} {st.st_mtime_ns}"
+
+    if output_file.exists():
+        st = output_file.stat()
+        if stamp_file.exists() and stamp_file.read_text().strip() == stamp_for(st):
+            return
+        if st.st_size == len(stdout) and output_file.read_bytes() == stdout:
+            stamp_file.write_text(stamp_for(st) + "\n")
+            return
+
+    tmp_file = output_file.with_name(output_file.name + ".tmp")
+    with open(tmp_file, "wb") as f:
         f.write(stdout)
+    os.replace(tmp_file, output_file)
+    stamp_file.write_text(stamp_for(output_file.stat()) + "\n")
 
 
-def run_regression_tests():
+def run_regression_tests(fail_fast: bool = False):
     """Run all Python regression tests from tests/regressions/."""
     if not REGRESSIONS_DIR.exists():
         print(f"Regression tests directory '{REGRESSIONS_DIR}' not found.")
@@ -173,22 +221,28 @@ def run_regression_tests():
             for line in stderr.splitlines()[:10]:  # First 10 lines of error
                 print(f"       {line}")
 
-    # Summary
-    print()
-    print("=" * 60)
-    print("Regression Test Summary")
-    print("=" * 60)
-    print(f"Passed: {passed}/{len(regression_tests)}")
-    print(f"Failed: {failed}/{len(regression_tests)}")
-    print()
+        if status == "FAIL" and fail_fast:
+            print("Stopping at first failure (--fail-fast)")
+            break
+
+    # Summary (buffered and written in one go)
+    buf = io.StringIO()
+    print(file=buf)
+    print("=" * 60, file=buf)
+    print("Regression Test Summary", file=buf)
+    print("=" * 60, file=buf)
+    print(f"Passed: {passed}/{len(regression_tests)}", file=buf)
+    print(f"Failed: {failed}/{len(regression_tests)}", file=buf)
+    print(file=buf)
 
     # Results table
-    print("Results:")
-    print("-" * 60)
-    print(f"{'Test':<40} {'Status':<6} {'Exit Code'}")
-    print("-" * 60)
+    print("Results:", file=buf)
+    print("-" * 60, file=buf)
+    print(f"{'Test':<40} {'Status':<6} {'Exit Code'}", file=buf)
+    print("-" * 60, file=buf)
     for test_name, status, code, _ in results:
-        print(f"{test_name:<40} {status:<6} {code}")
+        print(f"{test_name:<40} {status:<6} {code}", file=buf)
+    sys.stdout.write(buf.getvalue())
 
     # Exit with failure if any test failed
     if failed > 0:
@@ -203,10 +257,15 @@ def main():
         action="store_true",
         help="Run regression tests from tests/regressions/",
     )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first failing test",
+    )
     args = parser.parse_args()
 
     if args.regressions:
-        run_regression_tests()
+        run_regression_tests(args.fail_fast)
         return
 
     if not BUILD_DIR.exists():
@@ -250,27 +309,38 @@ def main():
             for line in stderr.splitlines()[:5]:  # First 5 lines of error
                 print(f"       {line}")
 
+        if code != 0 and args.fail_fast:
+            print("Stopping at first failure (--fail-fast)")
+            break
+
     print()
     print("=" * 60)
     print("Running Python tests and comparing to golden masters")
     print("=" * 60)
 
+    cpp_outputs = {test: (code, stdout) for test, _, code, stdout in cpp_results}
+
     # Run Python tests and compare
     for test in TESTS:
+        if cpp_failed > 0 and args.fail_fast:
+            break
         if test not in PYTHON_TESTS:
             py_skipped += 1
             continue
 
+        # Find the corresponding C++ output
+        cpp_code, cpp_stdout = cpp_outputs.get(test, (None, None))
+
+        # Without a passing golden master there is nothing to compare against
+        if cpp_code is not None and cpp_code != 0:
+            py_skipped += 1
+            py_results.append((test, "SKIP", "C++ test failed"))
+            print(f"[SKIP] {test} (C++ test failed)")
+            continue
+
         script = PYTHON_TESTS[test]
         py_stdout, py_stderr, py_code = run_python_test(script)
 
-        # Find the corresponding C++ output
-        cpp_stdout = None
-        for t, s, c, out in cpp_results:
-            if t == test:
-                cpp_stdout = out
-                break
-
         if py_code != 0:
             status = "FAIL"
             py_failed += 1
@@ -303,50 +373,60 @@ def main():
         # Show diff if output differs
         if status == "FAIL" and reason == "output differs from C++" and cpp_stdout:
             print("       --- First difference ---")
-            cpp_lines = cpp_stdout.splitlines()
-            py_lines = py_stdout.splitlines()
-            for i, (cpp_line, py_line) in enumerate(zip(cpp_lines, py_lines)):
-                if cpp_line != py_line:
-                    print(f"       Line {i + 1}:")
-                    print(f"       C++: {cpp_line[:60]}")
-                    print(f"       Py:  {py_line[:60]}")
-                    break
+            offset = find_first_diff(cpp_stdout, py_stdout)
+            cpp_line = line_at(cpp_stdout, offset)
+            py_line = line_at(py_stdout, offset)
+            if cpp_line != py_line:
+                line_no = cpp_stdout.count(b"\n", 0, offset) + 1
+                print(f"       Line {line_no}:")
+                print(f"       C++: {cpp_line[:60]}")
+                print(f"       Py:  {py_line[:60]}")
             else:
-                if len(cpp_lines) != len(py_lines):
-                    print(
-                        f"       Line count: C++={len(cpp_lines)}, Py={len(py_lines)}"
-                    )
-
-    # Summary
-    print()
-    print("=" * 60)
-    print("Summary")
-    print("=" * 60)
-    print()
-    print(f"C++ tests:    {cpp_passed} passed, {cpp_failed} failed out of {len(TESTS)}")
+                cpp_count = len(cpp_stdout.splitlines())
+                py_count = len(py_stdout.splitlines())
+                if cpp_count != py_count:
+                    print(f"       Line count: C++={cpp_count}, Py={py_count}")
+
+        if status == "FAIL" and args.fail_fast:
+            print("Stopping at first failure (--fail-fast)")
+            break
+
+    # Summary (buffered and written in one go)
+    buf = io.StringIO()
+    print(file=buf)
+    print("=" * 60, file=buf)
+    print("Summary", file=buf)
+    print("=" * 60, file=buf)
+    print(file=buf)
     print(
-        f"Python tests: {py_passed} passed, {py_failed} failed, {py_skipped} skipped out of {len(TESTS)}"
+        f"C++ tests:    {cpp_passed} passed, {cpp_failed} failed out of {len(TESTS)}",
+        file=buf,
     )
-    print(f"Golden masters saved to: {OUTPUT_DIR}/")
-    print()
+    print(
+        f"Python tests: {py_passed} passed, {py_failed} failed, {py_skipped} skipped out of {len(TESTS)}",
+        file=buf,
+    )
+    print(f"Golden masters saved to: {OUTPUT_DIR}/", file=buf)
+    print(file=buf)
 
     # C++ results table
-    print("C++ Test Results:")
-    print("-" * 50)
-    print(f"{'Test':<30} {'Status':<6} {'Exit Code'}")
-    print("-" * 50)
+    print("C++ Test Results:", file=buf)
+    print("-" * 50, file=buf)
+    print(f"{'Test':<30} {'Status':<6} {'Exit Code'}", file=buf)
+    print("-" * 50, file=buf)
     for test, status, code, _ in cpp_results:
-        print(f"{test:<30} {status:<6} {code}")
+        print(f"{test:<30} {status:<6} {code}", file=buf)
 
     # Python results table (only if there are any)
     if py_results:
-        print()
-        print("Python Test Results:")
-        print("-" * 50)
-        print(f"{'Test':<30} {'Status':<6} {'Notes'}")
-        print("-" * 50)
+        print(file=buf)
+        print("Python Test Results:", file=buf)
+        print("-" * 50, file=buf)
+        print(f"{'Test':<30} {'Status':<6} {'Notes'}", file=buf)
+        print("-" * 50, file=buf)
         for test, status, reason in py_results:
-            print(f"{test:<30} {status:<6} {reason}")
+            print(f"{test:<30} {status:<6} {reason}", file=buf)
+    sys.stdout.write(buf.getvalue())
 
     # Exit with failure if any test failed
     if cpp_failed > 0 or py_failed > 0:
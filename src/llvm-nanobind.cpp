@@ -3,15 +3,23 @@
 #include <nanobind/stl/optional.h>
 #include <nanobind/stl/pair.h>
 #include <nanobind/stl/string.h>
+#include <nanobind/stl/tuple.h>
 #include <nanobind/stl/vector.h>
 
 #include <atomic>
 #include <cctype>
+#include <cerrno>
+#include <cstring>
 #include <memory>
 #include <mutex>
 #include <stdexcept>
 #include <unordered_map>
 #include <unordered_set>
+#ifdef _WIN32
+#include <io.h>
+#else
+#include <unistd.h>
+#endif
 
 #include <llvm-c/Analysis.h>
 #include <llvm-c/BitReader.h>
@@ -130,8 +138,10 @@ struct DiagnosticRegistry {
 struct ValidityToken {
   std::atomic<bool> valid{true};
 
-  void invalidate() { valid = false; }
-  bool is_valid() const { return valid.load(); }
+  // Checked on every wrapper access; acquire/release is enough to order
+  // the flag against the teardown that precedes invalidate().
+  void invalidate() { valid.store(false, std::memory_order_release); }
+  bool is_valid() const { return valid.load(std::memory_order_acquire); }
 };
 
 // =============================================================================
@@ -443,6 +453,10 @@ struct LLVMTypeWrapper {
       throw LLVMMemoryError("Type used after context was destroyed");
   }
 
+  bool is_valid() const {
+    return m_ref != nullptr && m_context_token && m_context_token->is_valid();
+  }
+
   LLVMTypeKind kind() const {
     check_valid();
     return LLVMGetTypeKind(m_ref);
@@ -675,6 +689,10 @@ struct LLVMTypeWrapper {
   // Integer constant: ty.constant(42)
   LLVMValueWrapper constant(long long val, bool sign_extend = false) const;
 
+  // Integer constants in bulk: ty.constants([1, 2, 3])
+  std::vector<LLVMValueWrapper>
+  constants(const std::vector<long long> &vals, bool sign_extend = false) const;
+
   // Integer constant from string: ty.constant_from_string("123456789", 10)
   LLVMValueWrapper constant_from_string(const std::string &text,
                                         unsigned radix = 10) const;
@@ -682,6 +700,10 @@ struct LLVMTypeWrapper {
   // Float constant: ty.real_constant(3.14)
   LLVMValueWrapper real_constant(double val) const;
 
+  // Float constants in bulk: ty.real_constants([1.0, 2.5])
+  std::vector<LLVMValueWrapper>
+  real_constants(const std::vector<double> &vals) const;
+
   // Float constant from string: ty.real_constant_from_string("3.14159")
   LLVMValueWrapper real_constant_from_string(const std::string &text) const;
 
@@ -735,6 +757,23 @@ inline LLVMTypeWrapper LLVMAttributeWrapper::get_type_value() const {
   return LLVMTypeWrapper(ty, m_context_token);
 }
 
+// =============================================================================
+// Common Types (primitive types of a context, fetched in one call)
+// =============================================================================
+
+struct LLVMCommonTypesWrapper {
+  LLVMTypeWrapper i1;
+  LLVMTypeWrapper i8;
+  LLVMTypeWrapper i16;
+  LLVMTypeWrapper i32;
+  LLVMTypeWrapper i64;
+  LLVMTypeWrapper f16;
+  LLVMTypeWrapper f32;
+  LLVMTypeWrapper f64;
+  LLVMTypeWrapper void_;
+  LLVMTypeWrapper ptr;
+};
+
 // =============================================================================
 // Type Factory Wrapper (property-based namespace for type creation)
 // =============================================================================
@@ -993,6 +1032,26 @@ struct LLVMTypeFactoryWrapper {
       return std::nullopt;
     return LLVMTypeWrapper(ty, m_context_token);
   }
+
+  // All common primitive types in a single call
+  LLVMCommonTypesWrapper common() const {
+    check_valid();
+    auto wrap = [this](LLVMTypeRef ty) {
+      return LLVMTypeWrapper(ty, m_context_token);
+    };
+    return LLVMCommonTypesWrapper{
+        wrap(LLVMInt1TypeInContext(m_ctx_ref)),
+        wrap(LLVMInt8TypeInContext(m_ctx_ref)),
+        wrap(LLVMInt16TypeInContext(m_ctx_ref)),
+        wrap(LLVMInt32TypeInContext(m_ctx_ref)),
+        wrap(LLVMInt64TypeInContext(m_ctx_ref)),
+        wrap(LLVMHalfTypeInContext(m_ctx_ref)),
+        wrap(LLVMFloatTypeInContext(m_ctx_ref)),
+        wrap(LLVMDoubleTypeInContext(m_ctx_ref)),
+        wrap(LLVMVoidTypeInContext(m_ctx_ref)),
+        wrap(LLVMPointerTypeInContext(m_ctx_ref, 0)),
+    };
+  }
 };
 
 // =============================================================================
@@ -1102,6 +1161,10 @@ struct LLVMValueWrapper {
       throw LLVMMemoryError("Value used after context was destroyed");
   }
 
+  bool is_valid() const {
+    return m_ref != nullptr && m_context_token && m_context_token->is_valid();
+  }
+
   static const char *opcode_name(LLVMOpcode op) {
     switch (op) {
     case LLVMRet:
@@ -3053,6 +3116,10 @@ struct LLVMBasicBlockWrapper {
       throw LLVMMemoryError("BasicBlock used after context was destroyed");
   }
 
+  bool is_valid() const {
+    return m_ref != nullptr && m_context_token && m_context_token->is_valid();
+  }
+
   std::string get_name() const {
     check_valid();
     const char *name = LLVMGetBasicBlockName(m_ref);
@@ -3518,18 +3585,24 @@ struct LLVMFunctionWrapper : LLVMValueWrapper {
   }
 
   LLVMBasicBlockWrapper append_basic_block(const std::string &name) {
-    check_valid();
-    auto module = LLVMGetGlobalParent(m_ref);
-    if (module == nullptr)
-      throw LLVMAssertionError("Function has no parent module");
-    auto context = LLVMGetModuleContext(module);
-    if (context == nullptr)
-      throw LLVMAssertionError("Function module has no context");
     LLVMBasicBlockRef bb =
-        LLVMAppendBasicBlockInContext(context, m_ref, name.c_str());
+        LLVMAppendBasicBlockInContext(block_context(), m_ref, name.c_str());
     return LLVMBasicBlockWrapper(bb, m_context_token);
   }
 
+  std::vector<LLVMBasicBlockWrapper>
+  append_basic_blocks(const std::vector<std::string> &names) {
+    LLVMContextRef context = block_context();
+    std::vector<LLVMBasicBlockWrapper> result;
+    result.reserve(names.size());
+    for (const auto &name : names) {
+      LLVMBasicBlockRef bb =
+          LLVMAppendBasicBlockInContext(context, m_ref, name.c_str());
+      result.emplace_back(bb, m_context_token);
+    }
+    return result;
+  }
+
   LLVMBasicBlockWrapper entry_block() const {
     check_valid();
     if (LLVMIsDeclaration(m_ref)) {
@@ -3590,6 +3663,18 @@ struct LLVMFunctionWrapper : LLVMValueWrapper {
     return result;
   }
 
+  std::vector<std::string> basic_block_names() const {
+    check_valid();
+    std::vector<std::string> result;
+    result.reserve(LLVMCountBasicBlocks(m_ref));
+    for (LLVMBasicBlockRef bb = LLVMGetFirstBasicBlock(m_ref); bb;
+         bb = LLVMGetNextBasicBlock(bb)) {
+      const char *name = LLVMGetBasicBlockName(bb);
+      result.emplace_back(name ? name : "");
+    }
+    return result;
+  }
+
   void append_existing_basic_block(const LLVMBasicBlockWrapper &bb) {
     check_valid();
     bb.check_valid();
@@ -3838,6 +3923,19 @@ struct LLVMFunctionWrapper : LLVMValueWrapper {
     return LLVMValueWrapper(LLVMBlockAddress(m_ref, bb.m_ref),
                             m_context_token);
   }
+
+private:
+  // Context to create new blocks in, looked up through the parent module.
+  LLVMContextRef block_context() const {
+    check_valid();
+    auto module = LLVMGetGlobalParent(m_ref);
+    if (module == nullptr)
+      throw LLVMAssertionError("Function has no parent module");
+    auto context = LLVMGetModuleContext(module);
+    if (context == nullptr)
+      throw LLVMAssertionError("Function module has no context");
+    return context;
+  }
 };
 
 // =============================================================================
@@ -3861,6 +3959,32 @@ inline LLVMValueWrapper LLVMTypeWrapper::real_constant(double val) const {
   return LLVMValueWrapper(LLVMConstReal(m_ref, val), m_context_token);
 }
 
+inline std::vector<LLVMValueWrapper>
+LLVMTypeWrapper::constants(const std::vector<long long> &vals,
+                           bool sign_extend) const {
+  check_valid();
+  if (!is_integer())
+    throw LLVMAssertionError("constants() requires integer type");
+  std::vector<LLVMValueWrapper> result;
+  result.reserve(vals.size());
+  for (long long val : vals)
+    result.emplace_back(LLVMConstInt(m_ref, val, sign_extend),
+                        m_context_token);
+  return result;
+}
+
+inline std::vector<LLVMValueWrapper>
+LLVMTypeWrapper::real_constants(const std::vector<double> &vals) const {
+  check_valid();
+  if (!is_float())
+    throw LLVMAssertionError("real_constants() requires floating-point type");
+  std::vector<LLVMValueWrapper> result;
+  result.reserve(vals.size());
+  for (double val : vals)
+    result.emplace_back(LLVMConstReal(m_ref, val), m_context_token);
+  return result;
+}
+
 inline LLVMValueWrapper
 LLVMTypeWrapper::constant_from_string(const std::string &text,
                                       unsigned radix) const {
@@ -4118,6 +4242,33 @@ LLVMValueWrapper::add_handler(const LLVMBasicBlockWrapper &handler) {
 // Builder Wrapper
 // =============================================================================
 
+// Validated LLVMValueRef operands for a builder call. Short operand lists
+// (GEP indices are usually one to three) stay on the stack.
+struct ValueRefArray : NoMoveCopy {
+  static constexpr size_t kInlineSize = 8;
+
+  explicit ValueRefArray(const std::vector<LLVMValueWrapper> &values)
+      : m_size(static_cast<unsigned>(values.size())) {
+    if (values.size() > kInlineSize) {
+      m_heap.resize(values.size());
+      m_data = m_heap.data();
+    }
+    for (size_t i = 0; i < values.size(); ++i) {
+      values[i].check_valid();
+      m_data[i] = values[i].m_ref;
+    }
+  }
+
+  LLVMValueRef *data() { return m_data; }
+  unsigned size() const { return m_size; }
+
+private:
+  LLVMValueRef m_inline[kInlineSize];
+  std::vector<LLVMValueRef> m_heap;
+  LLVMValueRef *m_data = m_inline;
+  unsigned m_size;
+};
+
 struct LLVMBuilderWrapper : NoMoveCopy {
   LLVMBuilderRef m_ref = nullptr;
   std::shared_ptr<ValidityToken> m_context_token;
@@ -4563,6 +4714,25 @@ struct LLVMBuilderWrapper : NoMoveCopy {
         m_context_token);
   }
 
+  // Batched binary operations: one binding call for a run of instructions
+  std::vector<LLVMValueWrapper>
+  binops(const std::vector<std::tuple<LLVMOpcode, LLVMValueWrapper,
+                                      LLVMValueWrapper, std::string>> &specs) {
+    check_valid();
+    for (const auto &[opcode, lhs, rhs, name] : specs) {
+      lhs.check_valid();
+      rhs.check_valid();
+    }
+    std::vector<LLVMValueWrapper> result;
+    result.reserve(specs.size());
+    for (const auto &[opcode, lhs, rhs, name] : specs) {
+      result.emplace_back(
+          LLVMBuildBinOp(m_ref, opcode, lhs.m_ref, rhs.m_ref, name.c_str()),
+          m_context_token);
+    }
+    return result;
+  }
+
   // Memory operations
   LLVMValueWrapper build_alloca(const LLVMTypeWrapper &ty,
                                 const std::string &name = "") {
@@ -4608,16 +4778,11 @@ struct LLVMBuilderWrapper : NoMoveCopy {
     check_valid();
     ty.check_valid();
     ptr.check_valid();
-    std::vector<LLVMValueRef> idx_refs;
-    idx_refs.reserve(indices.size());
-    for (const auto &idx : indices) {
-      idx.check_valid();
-      idx_refs.push_back(idx.m_ref);
-    }
-    return LLVMValueWrapper(
-        LLVMBuildGEP2(m_ref, ty.m_ref, ptr.m_ref, idx_refs.data(),
-                      static_cast<unsigned>(idx_refs.size()), name.c_str()),
-        m_context_token);
+    ValueRefArray idx_refs(indices);
+    return LLVMValueWrapper(LLVMBuildGEP2(m_ref, ty.m_ref, ptr.m_ref,
+                                          idx_refs.data(), idx_refs.size(),
+                                          name.c_str()),
+                            m_context_token);
   }
 
   LLVMValueWrapper inbounds_gep(const LLVMTypeWrapper &ty,
@@ -4627,17 +4792,11 @@ struct LLVMBuilderWrapper : NoMoveCopy {
     check_valid();
     ty.check_valid();
     ptr.check_valid();
-    std::vector<LLVMValueRef> idx_refs;
-    idx_refs.reserve(indices.size());
-    for (const auto &idx : indices) {
-      idx.check_valid();
-      idx_refs.push_back(idx.m_ref);
-    }
-    return LLVMValueWrapper(
-        LLVMBuildInBoundsGEP2(m_ref, ty.m_ref, ptr.m_ref, idx_refs.data(),
-                              static_cast<unsigned>(idx_refs.size()),
-                              name.c_str()),
-        m_context_token);
+    ValueRefArray idx_refs(indices);
+    return LLVMValueWrapper(LLVMBuildInBoundsGEP2(m_ref, ty.m_ref, ptr.m_ref,
+                                                  idx_refs.data(),
+                                                  idx_refs.size(), name.c_str()),
+                            m_context_token);
   }
 
   LLVMValueWrapper struct_gep(const LLVMTypeWrapper &ty,
@@ -5426,6 +5585,28 @@ struct LLVMBuilderWrapper : NoMoveCopy {
 // Module Wrapper
 // =============================================================================
 
+// Write a whole buffer to fd, retrying on EINTR. Returns false on error.
+// The buffer must be private to the caller: the GIL is released so other
+// Python threads may run while a slow pipe or terminal drains it.
+inline bool write_all_to_fd(int fd, const char *data, size_t remaining) {
+  nb::gil_scoped_release release;
+  while (remaining > 0) {
+#ifdef _WIN32
+    auto written = _write(fd, data, static_cast<unsigned>(remaining));
+#else
+    auto written = ::write(fd, data, remaining);
+#endif
+    if (written < 0) {
+      if (errno == EINTR)
+        continue;
+      return false;
+    }
+    data += written;
+    remaining -= static_cast<size_t>(written);
+  }
+  return true;
+}
+
 struct LLVMModuleWrapper : NoMoveCopy {
   LLVMModuleRef m_ref = nullptr;
   std::shared_ptr<ValidityToken> m_context_token;
@@ -5470,13 +5651,12 @@ struct LLVMModuleWrapper : NoMoveCopy {
         LLVMDisposeModule(m_ref);
       } else {
         // Context is gone - module was already freed with it, or we must leak
-        // to avoid crash. Log a warning for debugging.
+        // to avoid crash. Report it as a ResourceWarning, like an unclosed
+        // file, so callers can filter or record it with the warnings module.
         // Note: In LLVM, modules are NOT automatically freed when context is
         // destroyed, so this represents a leak. But leaking is better than
         // crashing.
-        fprintf(stderr, "Warning: LLVM Module outlived its Context. "
-                        "This may cause a memory leak. "
-                        "Ensure modules are deleted before their context.\n");
+        warn_module_leak();
       }
       m_ref = nullptr;
     }
@@ -5486,6 +5666,21 @@ struct LLVMModuleWrapper : NoMoveCopy {
     }
   }
 
+  static void warn_module_leak() {
+    constexpr const char *msg =
+        "LLVM Module outlived its Context. This may cause a memory leak. "
+        "Ensure modules are deleted before their context.";
+    if (!Py_IsInitialized()) {
+      fprintf(stderr, "Warning: %s\n", msg);
+      return;
+    }
+    // Runs from a destructor: keep any in-flight exception intact and never
+    // let the warning itself (e.g. under -W error) escape.
+    nb::error_scope scope;
+    if (PyErr_WarnEx(PyExc_ResourceWarning, msg, 1) < 0)
+      PyErr_WriteUnraisable(nullptr);
+  }
+
   void check_valid() const {
     if (!m_ref)
       throw LLVMMemoryError("Module has been disposed");
@@ -5566,12 +5761,33 @@ struct LLVMModuleWrapper : NoMoveCopy {
   }
 
   // Global variables
-  LLVMValueWrapper add_global(const LLVMTypeWrapper &ty,
-                              const std::string &name) {
+  LLVMValueWrapper
+  add_global(const LLVMTypeWrapper &ty, const std::string &name,
+             const std::optional<LLVMValueWrapper> &initializer = std::nullopt,
+             bool constant = false) {
     check_valid();
     ty.check_valid();
-    return LLVMValueWrapper(LLVMAddGlobal(m_ref, ty.m_ref, name.c_str()),
-                            m_context_token);
+    if (initializer)
+      initializer->check_valid();
+    LLVMValueRef global = LLVMAddGlobal(m_ref, ty.m_ref, name.c_str());
+    if (initializer)
+      LLVMSetInitializer(global, initializer->m_ref);
+    if (constant)
+      LLVMSetGlobalConstant(global, 1);
+    return LLVMValueWrapper(global, m_context_token);
+  }
+
+  std::vector<LLVMValueWrapper> add_globals(
+      const std::vector<std::pair<LLVMTypeWrapper, std::string>> &specs) {
+    check_valid();
+    for (const auto &[ty, name] : specs)
+      ty.check_valid();
+    std::vector<LLVMValueWrapper> result;
+    result.reserve(specs.size());
+    for (const auto &[ty, name] : specs)
+      result.emplace_back(LLVMAddGlobal(m_ref, ty.m_ref, name.c_str()),
+                          m_context_token);
+    return result;
   }
 
   LLVMValueWrapper add_global_in_address_space(const LLVMTypeWrapper &ty,
@@ -5618,6 +5834,15 @@ struct LLVMModuleWrapper : NoMoveCopy {
     return result;
   }
 
+  unsigned global_count() const {
+    check_valid();
+    unsigned count = 0;
+    for (LLVMValueRef g = LLVMGetFirstGlobal(m_ref); g;
+         g = LLVMGetNextGlobal(g))
+      ++count;
+    return count;
+  }
+
   // Function iteration
   std::vector<LLVMFunctionWrapper> functions() {
     check_valid();
@@ -5654,14 +5879,24 @@ struct LLVMModuleWrapper : NoMoveCopy {
     return result;
   }
 
+  /// Write the module IR to an open file descriptor without building a
+  /// Python string.
+  void write_to_fd(int fd) const {
+    check_valid();
+    char *str = LLVMPrintModuleToString(m_ref);
+    bool failed = !write_all_to_fd(fd, str, std::strlen(str));
+    LLVMDisposeMessage(str);
+    if (failed)
+      throw LLVMError("Failed to write module to file descriptor " +
+                      std::to_string(fd));
+  }
+
   // Verification
   bool verify() const {
     check_valid();
-    char *error = nullptr;
-    LLVMBool failed = LLVMVerifyModule(m_ref, LLVMReturnStatusAction, &error);
-    if (error)
-      LLVMDisposeMessage(error);
-    return !failed;
+    // No message buffer: the verifier skips formatting diagnostics.
+    // get_verification_error() produces the text when it is needed.
+    return !LLVMVerifyModule(m_ref, LLVMReturnStatusAction, nullptr);
   }
 
   std::string get_verification_error() const {
@@ -5704,6 +5939,22 @@ struct LLVMModuleWrapper : NoMoveCopy {
     }
   }
 
+  /// Write bitcode straight to an open file descriptor (e.g. stdout).
+  void write_bitcode_to_fd(int fd) {
+    check_valid();
+    // LLVMWriteBitcodeToFD aborts on write errors, so serialize to memory
+    // and write the buffer ourselves to surface them as LLVMError.
+    LLVMMemoryBufferRef buf = LLVMWriteBitcodeToMemoryBuffer(m_ref);
+    if (!buf)
+      throw LLVMError("Failed to write bitcode to memory buffer");
+    bool failed = !write_all_to_fd(fd, LLVMGetBufferStart(buf),
+                                   LLVMGetBufferSize(buf));
+    LLVMDisposeMemoryBuffer(buf);
+    if (failed)
+      throw LLVMError("Failed to write bitcode to file descriptor " +
+                      std::to_string(fd));
+  }
+
   /// Write bitcode to memory and return as bytes.
   nb::bytes write_bitcode_to_memory_buffer() {
     check_valid();
@@ -6666,9 +6917,14 @@ LLVMModuleManager *LLVMContextWrapper::parse_bitcode_from_bytes(nb::bytes data,
   check_valid();
   clear_diagnostics();
 
-  // Create memory buffer with a copy (LLVM will own it on success)
-  auto buf = LLVMCreateMemoryBufferWithMemoryRangeCopy(data.c_str(),
-                                                       data.size(), "<bytes>");
+  // An eager parse reads the buffer only during this call, while `data`
+  // keeps the bytes alive, so it can borrow them. A lazy module keeps the
+  // buffer for later materialization and needs its own copy.
+  auto buf = lazy ? LLVMCreateMemoryBufferWithMemoryRangeCopy(
+                        data.c_str(), data.size(), "<bytes>")
+                  : LLVMCreateMemoryBufferWithMemoryRange(
+                        data.c_str(), data.size(), "<bytes>",
+                        /*RequiresNullTerminator=*/0);
 
   // Parse bitcode
   LLVMModuleRef mod_ref;
@@ -7906,6 +8162,10 @@ struct LLVMBinaryWrapper : NoMoveCopy {
     LLVMDisposeMemoryBuffer(buf);
     return result;
   }
+
+  void check_object_file(const char *api_name) const;
+  std::vector<std::string> section_names() const;
+  std::vector<std::string> symbol_names() const;
 };
 
 inline const char *binary_type_name(LLVMBinaryType type) {
@@ -7965,6 +8225,44 @@ inline bool binary_supports_object_iterators(LLVMBinaryType type) {
   }
 }
 
+inline void LLVMBinaryWrapper::check_object_file(const char *api_name) const {
+  check_valid();
+  LLVMBinaryType type = get_type();
+  if (!binary_supports_object_iterators(type)) {
+    throw LLVMAssertionError(std::string(api_name) +
+                             " requires an object-file binary (got " +
+                             binary_type_name(type) + ")");
+  }
+}
+
+/// Collect all section names in one pass, without a Python-side iterator.
+inline std::vector<std::string> LLVMBinaryWrapper::section_names() const {
+  check_object_file("section_names");
+  std::vector<std::string> names;
+  LLVMSectionIteratorRef it = LLVMObjectFileCopySectionIterator(m_ref);
+  for (; !LLVMObjectFileIsSectionIteratorAtEnd(m_ref, it);
+       LLVMMoveToNextSection(it)) {
+    const char *name = LLVMGetSectionName(it);
+    names.emplace_back(name ? name : "");
+  }
+  LLVMDisposeSectionIterator(it);
+  return names;
+}
+
+/// Collect all symbol names in one pass, without a Python-side iterator.
+inline std::vector<std::string> LLVMBinaryWrapper::symbol_names() const {
+  check_object_file("symbol_names");
+  std::vector<std::string> names;
+  LLVMSymbolIteratorRef it = LLVMObjectFileCopySymbolIterator(m_ref);
+  for (; !LLVMObjectFileIsSymbolIteratorAtEnd(m_ref, it);
+       LLVMMoveToNextSymbol(it)) {
+    const char *name = LLVMGetSymbolName(it);
+    names.emplace_back(name ? name : "");
+  }
+  LLVMDisposeSymbolIterator(it);
+  return names;
+}
+
 // Section iterator - holds validity token from binary
 struct LLVMSectionIteratorWrapper : NoMoveCopy {
   LLVMSectionIteratorRef m_ref = nullptr;
@@ -10633,6 +10931,8 @@ NB_MODULE(llvm, m) {
 
   // Type wrapper
   nb::class_<LLVMTypeWrapper>(m, "Type")
+      .def_prop_ro("is_valid", &LLVMTypeWrapper::is_valid,
+                   R"(Check if type is valid (its context is still alive).)")
       .def("__eq__", [](const LLVMTypeWrapper &a,
                         const LLVMTypeWrapper &b) { return a == b; })
       .def("__ne__", [](const LLVMTypeWrapper &a,
@@ -10808,6 +11108,14 @@ Valid when:
 Valid when:
   - this type is an integer type
 
+<sub>C API: LLVMConstInt</sub>)")
+      .def("constants", &LLVMTypeWrapper::constants, "vals"_a,
+           "sign_extend"_a = false,
+           R"(Create one integer constant of this type per value.
+
+Valid when:
+  - this type is an integer type
+
 <sub>C API: LLVMConstInt</sub>)")
       .def("constant_from_string", &LLVMTypeWrapper::constant_from_string,
            "text"_a, "radix"_a = 10,
@@ -10830,6 +11138,13 @@ Args:
 Valid when:
   - this type is a floating-point type
 
+<sub>C API: LLVMConstReal</sub>)")
+      .def("real_constants", &LLVMTypeWrapper::real_constants, "vals"_a,
+           R"(Create one floating-point constant of this type per value.
+
+Valid when:
+  - this type is a floating-point type
+
 <sub>C API: LLVMConstReal</sub>)")
       .def("real_constant_from_string",
            &LLVMTypeWrapper::real_constant_from_string, "text"_a,
@@ -10958,6 +11273,8 @@ Args:
 
   // Value wrapper
   nb::class_<LLVMValueWrapper>(m, "Value")
+      .def_prop_ro("is_valid", &LLVMValueWrapper::is_valid,
+                   R"(Check if value is valid (its context is still alive).)")
       .def("__eq__", [](const LLVMValueWrapper &a,
                         const LLVMValueWrapper &b) { return a == b; })
       .def("__ne__", [](const LLVMValueWrapper &a,
@@ -11979,6 +12296,8 @@ Returns:
 
   // BasicBlock wrapper
   nb::class_<LLVMBasicBlockWrapper>(m, "BasicBlock")
+      .def_prop_ro("is_valid", &LLVMBasicBlockWrapper::is_valid,
+                   R"(Check if basic block is valid (its context is still alive).)")
       .def("__eq__", [](const LLVMBasicBlockWrapper &a,
                         const LLVMBasicBlockWrapper &b) { return a == b; })
       .def("__ne__", [](const LLVMBasicBlockWrapper &a,
@@ -12151,6 +12470,11 @@ Returns a BuilderManager for use with Python's 'with' statement.
           "name"_a = "",
           R"(Append basic block.
 
+<sub>C API: LLVMAppendBasicBlockInContext</sub>)")
+      .def("append_basic_blocks", &LLVMFunctionWrapper::append_basic_blocks,
+           "names"_a,
+           R"(Append one basic block per name, in order.
+
 <sub>C API: LLVMAppendBasicBlockInContext</sub>)")
       .def_prop_ro("entry_block", &LLVMFunctionWrapper::entry_block,
                    R"(Entry block.
@@ -12181,6 +12505,10 @@ Valid when:
                    R"(All blocks.
 
 <sub>C API: LLVMGetBasicBlocks</sub>)")
+      .def_prop_ro("basic_block_names", &LLVMFunctionWrapper::basic_block_names,
+                   R"(Names of all blocks, in order.
+
+<sub>C API: LLVMGetFirstBasicBlock, LLVMGetNextBasicBlock, LLVMGetBasicBlockName</sub>)")
       .def("append_existing_basic_block",
            &LLVMFunctionWrapper::append_existing_basic_block, "bb"_a,
            R"(Append existing block.
@@ -12524,6 +12852,13 @@ Valid when:
       .def("binop", &LLVMBuilderWrapper::binop, "opcode"_a, "lhs"_a, "rhs"_a,
            "name"_a = "", R"(Build binary op.
 
+<sub>C API: LLVMBuildBinOp</sub>)")
+      .def("binops", &LLVMBuilderWrapper::binops, "specs"_a,
+           R"(Build a sequence of binary ops in one call.
+
+Each spec is an (opcode, lhs, rhs, name) tuple. Returns the built values
+in the same order.
+
 <sub>C API: LLVMBuildBinOp</sub>)")
       // Memory
       .def("alloca", &LLVMBuilderWrapper::build_alloca, "ty"_a, "name"_a = "",
@@ -13043,8 +13378,15 @@ Valid when:
 
 <sub>C API: LLVMGetNamedFunction</sub>)")
       .def("add_global", &LLVMModuleWrapper::add_global, "ty"_a, "name"_a,
+           "initializer"_a = nb::none(), nb::kw_only(), "constant"_a = false,
            R"(Add a global variable.
 
+Optionally sets its initializer and marks it constant in the same call.
+
+<sub>C API: LLVMAddGlobal, LLVMSetInitializer, LLVMSetGlobalConstant</sub>)")
+      .def("add_globals", &LLVMModuleWrapper::add_globals, "specs"_a,
+           R"(Add one global variable per (type, name) pair, in order.
+
 <sub>C API: LLVMAddGlobal</sub>)")
       .def("add_global_in_address_space",
            &LLVMModuleWrapper::add_global_in_address_space, "ty"_a, "name"_a,
@@ -13067,6 +13409,10 @@ Valid when:
       .def_prop_ro("globals", &LLVMModuleWrapper::globals,
                    R"(All globals.
 
+<sub>C API: LLVMGetFirstGlobal, LLVMGetNextGlobal</sub>)")
+      .def_prop_ro("global_count", &LLVMModuleWrapper::global_count,
+                   R"(Number of globals, counted without creating wrappers.
+
 <sub>C API: LLVMGetFirstGlobal, LLVMGetNextGlobal</sub>)")
       .def_prop_ro("functions", &LLVMModuleWrapper::functions,
                    R"(All functions.
@@ -13084,6 +13430,15 @@ Valid when:
       .def("to_string", &LLVMModuleWrapper::to_string,
            R"(Get module as IR string.
 
+<sub>C API: LLVMPrintModuleToString</sub>)")
+      .def("write_to_fd", &LLVMModuleWrapper::write_to_fd, "fd"_a,
+           R"(Write module IR to an open file descriptor.
+
+Equivalent to writing to_string() to the descriptor, without creating
+the intermediate Python string. The descriptor is left open.
+Python-level buffers for the same file (e.g. sys.stdout) must be
+flushed first.
+
 <sub>C API: LLVMPrintModuleToString</sub>)")
       .def("verify", &LLVMModuleWrapper::verify,
            R"(Verify the module.
@@ -13194,6 +13549,15 @@ Valid when:
                path: Output file path
 
 <sub>C API: LLVMWriteBitcodeToFile</sub>)")
+      .def("write_bitcode_to_fd", &LLVMModuleWrapper::write_bitcode_to_fd,
+           "fd"_a,
+           R"(Write the module as bitcode to an open file descriptor.
+
+The descriptor is left open. Python-level buffers for the same file
+(e.g. sys.stdout) must be flushed first, since LLVM writes to the
+descriptor directly.
+
+<sub>C API: LLVMWriteBitcodeToMemoryBuffer</sub>)")
       .def("write_bitcode_to_memory_buffer",
            &LLVMModuleWrapper::write_bitcode_to_memory_buffer,
            R"(Write the module as bitcode to a bytes object.
@@ -13295,6 +13659,18 @@ Use with 'with' statement:
 <sub>C API: LLVMCreateDIBuilder</sub>)");
 
   // TypeFactory wrapper (property-based type namespace)
+  nb::class_<LLVMCommonTypesWrapper>(m, "CommonTypes")
+      .def_ro("i1", &LLVMCommonTypesWrapper::i1)
+      .def_ro("i8", &LLVMCommonTypesWrapper::i8)
+      .def_ro("i16", &LLVMCommonTypesWrapper::i16)
+      .def_ro("i32", &LLVMCommonTypesWrapper::i32)
+      .def_ro("i64", &LLVMCommonTypesWrapper::i64)
+      .def_ro("f16", &LLVMCommonTypesWrapper::f16)
+      .def_ro("f32", &LLVMCommonTypesWrapper::f32)
+      .def_ro("f64", &LLVMCommonTypesWrapper::f64)
+      .def_ro("void", &LLVMCommonTypesWrapper::void_)
+      .def_ro("ptr", &LLVMCommonTypesWrapper::ptr);
+
   nb::class_<LLVMTypeFactoryWrapper>(m, "TypeFactory")
       // Fixed-width integer types
       .def_prop_ro("i1", &LLVMTypeFactoryWrapper::i1,
@@ -13419,7 +13795,11 @@ Use with 'with' statement:
       .def("get", &LLVMTypeFactoryWrapper::get, "name"_a,
            R"(Get named struct type.
 
-<sub>C API: LLVMGetTypeByName2</sub>)");
+<sub>C API: LLVMGetTypeByName2</sub>)")
+      .def("common", &LLVMTypeFactoryWrapper::common,
+           R"(Common primitive types (i1-i64, f16/f32/f64, void, ptr) in one call.
+
+<sub>C API: LLVMInt*TypeInContext, LLVMPointerTypeInContext</sub>)");
 
   // Context wrapper
   nb::class_<LLVMContextWrapper>(m, "Context")
@@ -13474,13 +13854,17 @@ Returns a BuilderManager for use with Python's 'with' statement.
            "lazy"_a = false, nb::rv_policy::take_ownership,
            R"(Parse bitcode from file.
 
-<sub>C API: LLVMParseBitcodeInContext2</sub>)")
+With lazy=True, function bodies are materialized on demand.
+
+<sub>C API: LLVMParseBitcodeInContext2, LLVMGetBitcodeModuleInContext2</sub>)")
       .def("parse_bitcode_from_bytes",
            &LLVMContextWrapper::parse_bitcode_from_bytes, "data"_a,
            "lazy"_a = false, nb::rv_policy::take_ownership,
            R"(Parse bitcode from bytes.
 
-<sub>C API: LLVMParseBitcodeInContext2</sub>)")
+With lazy=True, function bodies are materialized on demand.
+
+<sub>C API: LLVMParseBitcodeInContext2, LLVMGetBitcodeModuleInContext2</sub>)")
       .def("parse_ir", &LLVMContextWrapper::parse_ir, "source"_a,
            "mod_name"_a = "<source>", nb::rv_policy::take_ownership,
            R"(Parse IR from string.
@@ -14374,6 +14758,20 @@ Valid when:
   - binary.type is an object-file type (COFF/ELF/MachO/Wasm)
 
 <sub>C API: LLVMObjectFileCopySymbolIterator</sub>)")
+      .def("section_names", &LLVMBinaryWrapper::section_names,
+           R"(Names of all sections, collected in a single call.
+
+Valid when:
+  - binary.type is an object-file type (COFF/ELF/MachO/Wasm)
+
+<sub>C API: LLVMObjectFileCopySectionIterator, LLVMGetSectionName</sub>)")
+      .def("symbol_names", &LLVMBinaryWrapper::symbol_names,
+           R"(Names of all symbols, collected in a single call.
+
+Valid when:
+  - binary.type is an object-file type (COFF/ELF/MachO/Wasm)
+
+<sub>C API: LLVMObjectFileCopySymbolIterator, LLVMGetSymbolName</sub>)")
       .def("copy_to_memory_buffer", &LLVMBinaryWrapper::copy_to_memory_buffer,
            R"(Copy the binary's contents to a memory buffer.
            
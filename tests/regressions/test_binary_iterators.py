@@ -43,6 +43,7 @@ def test_binary_iterators_match_manual_iteration():
             f"for-loop sections mismatch: {for_sections} != {manual_sections}"
         )
         assert len(for_sections) > 0
+        assert binary.section_names() == manual_sections
 
         # Symbols
         manual_symbols = _manual_symbol_names(binary)
@@ -50,6 +51,7 @@ def test_binary_iterators_match_manual_iteration():
         assert for_symbols == manual_symbols, (
             f"for-loop symbols mismatch: {for_symbols} != {manual_symbols}"
         )
+        assert binary.symbol_names() == manual_symbols
 
 
 if __name__ == "__main__":
@@ -15,17 +15,19 @@ with open(bitcode_path, "rb") as f:
     bitcode = f.read()
 
 with llvm.create_context() as ctx:
-    with ctx.parse_bitcode_from_bytes(bitcode) as mod:
-        print("Bitcode loaded successfully")
+    # Cover both the eager parse and the lazy (materialize on demand) path
+    for lazy in (False, True):
+        with ctx.parse_bitcode_from_bytes(bitcode, lazy=lazy) as mod:
+            print(f"Bitcode loaded successfully (lazy={lazy})")
 
-        func = mod.get_function("test")
-        assert func is not None, "Function 'test' not found in module"
-        print(f"Function loaded: {func}")
-        print(f"Function has {func.param_count} parameters")
+            func = mod.get_function("test")
+            assert func is not None, "Function 'test' not found in module"
+            print(f"Function loaded: {func}")
+            print(f"Function has {func.param_count} parameters")
 
-        print("\nCalling first_param()...")
-        try:
-            param = func.first_param()
-            print(f"SUCCESS: first_param = {param}")
-        except Exception as e:
-            print(f"FAILED: {e}")
+            print("\nCalling first_param()...")
+            try:
+                param = func.first_param()
+                print(f"SUCCESS: first_param = {param}")
+            except Exception as e:
+                print(f"FAILED: {e}")
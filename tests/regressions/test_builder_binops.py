@@ -0,0 +1,99 @@
+"""
+Regression tests for Builder.binops.
+
+binops() builds a run of (opcode, lhs, rhs, name) binary ops with
+LLVMBuildBinOp. It must emit exactly the same IR as the per-op builder
+methods, and it must validate every operand before emitting anything.
+"""
+
+import llvm
+
+
+INT_OPS = [
+    ("add", llvm.Opcode.Add),
+    ("sub", llvm.Opcode.Sub),
+    ("mul", llvm.Opcode.Mul),
+    ("sdiv", llvm.Opcode.SDiv),
+    ("udiv", llvm.Opcode.UDiv),
+    ("srem", llvm.Opcode.SRem),
+    ("urem", llvm.Opcode.URem),
+    ("and_", llvm.Opcode.And),
+    ("or_", llvm.Opcode.Or),
+    ("xor", llvm.Opcode.Xor),
+    ("shl", llvm.Opcode.Shl),
+    ("lshr", llvm.Opcode.LShr),
+    ("ashr", llvm.Opcode.AShr),
+]
+
+FP_OPS = [
+    ("fadd", llvm.Opcode.FAdd),
+    ("fsub", llvm.Opcode.FSub),
+    ("fmul", llvm.Opcode.FMul),
+    ("fdiv", llvm.Opcode.FDiv),
+    ("frem", llvm.Opcode.FRem),
+]
+
+
+def build_module(ctx, batched: bool) -> str:
+    """Build int and fp functions with either binops() or per-op calls."""
+    with ctx.create_module("binops") as mod:
+        types = ctx.types.common()
+        for ty, fn_name, ops in (
+            (types.i32, "int_ops", INT_OPS),
+            (types.f64, "fp_ops", FP_OPS),
+        ):
+            fn = mod.add_function(fn_name, ctx.types.function(ty, [ty, ty]))
+            lhs, rhs = fn.get_param(0), fn.get_param(1)
+            with fn.append_basic_block("entry").create_builder() as builder:
+                if batched:
+                    values = builder.binops(
+                        [(opcode, lhs, rhs, name) for name, opcode in ops]
+                    )
+                else:
+                    values = [
+                        getattr(builder, name)(lhs, rhs, name) for name, _ in ops
+                    ]
+                builder.ret(values[-1])
+        mod.verify_or_raise()
+        return str(mod)
+
+
+def test_binops_matches_single_op_builders():
+    with llvm.create_context() as ctx:
+        single = build_module(ctx, batched=False)
+        batched = build_module(ctx, batched=True)
+    assert batched == single, f"binops IR differs:\n{batched}\nvs\n{single}"
+
+
+def test_binops_validates_before_emitting():
+    with llvm.create_context() as other:
+        stale = other.types.i32.constant(1)
+
+    with llvm.create_context() as ctx:
+        with ctx.create_module("m") as mod:
+            i32 = ctx.types.i32
+            fn = mod.add_function("f", ctx.types.function(i32, [i32]))
+            x = fn.get_param(0)
+            entry = fn.append_basic_block("entry")
+            with entry.create_builder() as builder:
+                assert builder.binops([]) == []
+                try:
+                    builder.binops(
+                        [
+                            (llvm.Opcode.Add, x, x, "ok"),
+                            (llvm.Opcode.Add, x, stale, "bad"),
+                        ]
+                    )
+                except llvm.LLVMMemoryError:
+                    pass
+                else:
+                    raise AssertionError("Expected llvm.LLVMMemoryError")
+                assert entry.instructions == [], "binops emitted before failing"
+
+
+if __name__ == "__main__":
+    test_binops_matches_single_op_builders()
+    print("test_binops_matches_single_op_builders: PASSED")
+
+    test_binops_validates_before_emitting()
+    print("test_binops_validates_before_emitting: PASSED")
@@ -29,46 +29,57 @@ where the extra metadata is being created or where order differs. The C test
 is in llvm-c/llvm-c-test/debuginfo.c.
 """
 
+import contextlib
+import functools
+import io
+import re
 import subprocess
 import sys
 
+from llvm_c_test import debuginfo
+
+
+FOO_DBG_RE = re.compile(r"^define i64 @foo\(.*!dbg !(\d+)", re.M)
+
 
 def get_function_dbg_id(output: str) -> str | None:
     """Extract the !dbg ID from the function definition line."""
-    for line in output.split("\n"):
-        if line.startswith("define i64 @foo("):
-            # Find !dbg !XX
-            if "!dbg !" in line:
-                start = line.index("!dbg !") + len("!dbg !")
-                end = start
-                while end < len(line) and line[end].isdigit():
-                    end += 1
-                return line[start:end]
-    return None
-
-
-def run_python_dibuilder():
-    """Run Python --test-dibuilder and capture output."""
-    result = subprocess.run(
-        ["uv", "run", "llvm-c-test", "--test-dibuilder"],
-        capture_output=True,
-        text=True,
-    )
-    return result.stdout
+    m = FOO_DBG_RE.search(output)
+    return m.group(1) if m else None
 
 
-def run_c_dibuilder():
-    """Run C --test-dibuilder and capture output."""
-    result = subprocess.run(
+@functools.cache
+def run_python_dibuilder() -> str:
+    """Run Python --test-dibuilder in-process and capture output."""
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        debuginfo.test_dibuilder()
+    return buf.getvalue()
+
+
+@functools.cache
+def start_c_dibuilder() -> subprocess.Popen:
+    """Start C --test-dibuilder in the background."""
+    return subprocess.Popen(
         ["./build/llvm-c-test", "--test-dibuilder"],
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         text=True,
     )
-    return result.stdout
+
+
+@functools.cache
+def run_c_dibuilder() -> str:
+    """Wait for C --test-dibuilder and capture output."""
+    stdout, _ = start_c_dibuilder().communicate()
+    return stdout
 
 
 def test_dibuilder_metadata_ids():
     """Compare metadata IDs between C and Python implementations."""
+    # Let the C process run while the Python version builds its module
+    start_c_dibuilder()
+
     print("Running Python DIBuilder test...")
     py_output = run_python_dibuilder()
     py_id = get_function_dbg_id(py_output)
@@ -127,7 +138,7 @@ def count_metadata_before_subprogram():
 
     def count_before_subprogram(output: str) -> int:
         count = 0
-        for line in output.split("\n"):
+        for line in io.StringIO(output):
             line = line.strip()
             if line.startswith("!") and "=" in line:
                 if "DISubprogram" in line and 'name: "foo"' in line:
@@ -32,22 +32,28 @@ Current Python format:
       error: <message>
 """
 
+import functools
+import re
 import llvm
 from pathlib import Path
 
 
-def get_parse_error_message():
-    """Get the error message format from a parse failure."""
-    invalid_bc = Path(__file__).parent.parent.parent / (
-        "llvm-c/llvm-c-test/inputs/invalid.ll.bc"
-    )
+INVALID_BC = Path(__file__).parent.parent.parent / (
+    "llvm-c/llvm-c-test/inputs/invalid.ll.bc"
+)
+
+# A line whose first non-blank text is "error:"; group 1 is the rest of it
+ERROR_LINE_RE = re.compile(r"^[ \t]*error:(.*)$", re.M)
+
 
-    if not invalid_bc.exists():
-        print(f"Skipping test - invalid bitcode file not found: {invalid_bc}")
+@functools.cache
+def get_parse_error_message():
+    """Get the error message format from a parse failure (parsed only once)."""
+    if not INVALID_BC.exists():
+        print(f"Skipping test - invalid bitcode file not found: {INVALID_BC}")
         return None
 
-    with open(invalid_bc, "rb") as f:
-        bitcode = f.read()
+    bitcode = INVALID_BC.read_bytes()
 
     try:
         with llvm.create_context() as ctx:
@@ -98,16 +104,12 @@ def extract_error_message_hack(exception_msg: str) -> str:
 
     This is needed for llvm-c-test compatibility.
     """
-    lines = exception_msg.strip().split("\n")
-
-    for line in lines:
-        line = line.strip()
-        # Find line starting with "error:" and extract the message
-        if line.startswith("error:"):
-            return line[len("error:") :].strip()
-
-    # Fallback: return as-is
-    return exception_msg
+    # Take the rest of the first line that starts with "error:"
+    m = ERROR_LINE_RE.search(exception_msg)
+    if not m:
+        # Fallback: return as-is
+        return exception_msg
+    return m.group(1).strip()
 
 
 def test_error_message_extraction():
@@ -83,17 +83,17 @@ def test_function_metadata_accessors_require_has_checks():
 def test_function_metadata_accessors_work_when_present():
     with llvm.create_context() as ctx:
         with ctx.create_module("m") as mod:
-            void_ty = ctx.types.void
-            i32 = ctx.types.i32
-            fn_ty = ctx.types.function(void_ty, [])
-            personality_ty = ctx.types.function(i32, [], vararg=True)
+            types = ctx.types.common()
+            fn_ty = ctx.types.function(types.void, [])
+            personality_ty = ctx.types.function(types.i32, [], vararg=True)
+            null_ptr = types.ptr.null()
 
             personality = mod.add_function("__personality", personality_ty)
             fn = mod.add_function("f", fn_ty)
 
             fn.set_personality_fn(personality)
-            fn.set_prefix_data(ctx.types.ptr.null())
-            fn.set_prologue_data(ctx.types.ptr.null())
+            fn.set_prefix_data(null_ptr)
+            fn.set_prologue_data(null_ptr)
 
             assert fn.has_personality_fn
             assert fn.get_personality_fn() == personality
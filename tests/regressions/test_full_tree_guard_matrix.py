@@ -15,37 +15,27 @@ from pathlib import Path
 import llvm
 
 
-def assert_llvm_assertion(action, expected_substring: str):
+def _assert_raises(action, exc_type: type[Exception], expected_substring: str):
     try:
         action()
-        assert False, "Expected llvm.LLVMAssertionError"
-    except llvm.LLVMAssertionError as e:
-        msg = str(e).lower()
-        assert expected_substring.lower() in msg, (
+    except exc_type as e:
+        assert expected_substring.lower() in str(e).lower(), (
             f"Expected '{expected_substring}' in error message, got: {e}"
         )
+    else:
+        raise AssertionError(f"Expected llvm.{exc_type.__name__}")
+
+
+def assert_llvm_assertion(action, expected_substring: str):
+    _assert_raises(action, llvm.LLVMAssertionError, expected_substring)
 
 
 def assert_memory_error(action, expected_substring: str):
-    try:
-        action()
-        assert False, "Expected llvm.LLVMMemoryError"
-    except llvm.LLVMMemoryError as e:
-        msg = str(e).lower()
-        assert expected_substring.lower() in msg, (
-            f"Expected '{expected_substring}' in error message, got: {e}"
-        )
+    _assert_raises(action, llvm.LLVMMemoryError, expected_substring)
 
 
 def assert_llvm_error(action, expected_substring: str):
-    try:
-        action()
-        assert False, "Expected llvm.LLVMError"
-    except llvm.LLVMError as e:
-        msg = str(e).lower()
-        assert expected_substring.lower() in msg, (
-            f"Expected '{expected_substring}' in error message, got: {e}"
-        )
+    _assert_raises(action, llvm.LLVMError, expected_substring)
 
 
 def assert_out_of_range(action):
@@ -71,14 +61,16 @@ def test_helper_assertions_and_call_guards():
             left = fn.append_basic_block("left")
             right = fn.append_basic_block("right")
             merge = fn.append_basic_block("merge")
+            c0 = i32.constant(0, False)
+            c1 = i32.constant(1, False)
 
             with entry.create_builder() as b:
                 b.cond_br(fn.get_param(0), left, right)
 
                 b.position_at_end(left)
-                add_inst = b.add(fn.get_param(1), i32.constant(1, False), "add")
+                add_inst = b.add(fn.get_param(1), c1, "add")
                 switch_inst = b.switch_(fn.get_param(1), merge, 1)
-                switch_inst.add_case(i32.constant(0, False), merge)
+                switch_inst.add_case(c0, merge)
 
                 b.position_at_end(right)
                 b.br(merge)
@@ -89,16 +81,17 @@ def test_helper_assertions_and_call_guards():
                 phi.add_incoming(fn.get_param(1), right)
                 b.ret_void()
 
+            f1 = f32.real_constant(1.0)
             assert_llvm_assertion(
-                lambda: add_inst.add_incoming(i32.constant(0, False), merge),
+                lambda: add_inst.add_incoming(c0, merge),
                 "requires a phi node",
             )
             assert_llvm_assertion(
-                lambda: phi.add_incoming(f32.real_constant(1.0), merge),
+                lambda: phi.add_incoming(f1, merge),
                 "type mismatch",
             )
             assert_llvm_assertion(
-                lambda: add_inst.add_case(i32.constant(1, False), merge),
+                lambda: add_inst.add_case(c1, merge),
                 "requires a switch instruction",
             )
             assert_llvm_assertion(
@@ -46,27 +46,27 @@ def test_instruction_aliases_and_movement():
             assert term.parent == entry
 
             # Reorder within the same block.
-            entry_instrs = list(entry.instructions)
+            entry_instrs = entry.instructions
             assert entry_instrs[0] == a
             assert entry_instrs[1] == b
             assert entry_instrs[2].opcode_name == "br"
 
             b.move_before(a, preserve=True)
-            entry_instrs = list(entry.instructions)
+            entry_instrs = entry.instructions
             assert entry_instrs[0] == b
             assert entry_instrs[1] == a
             assert entry_instrs[2].opcode_name == "br"
 
             b.move_after(a, preserve=False)
-            entry_instrs = list(entry.instructions)
+            entry_instrs = entry.instructions
             assert entry_instrs[0] == a
             assert entry_instrs[1] == b
             assert entry_instrs[2].opcode_name == "br"
 
             # Move across blocks.
             b.move_before(x)
-            entry_instrs = list(entry.instructions)
-            exit_instrs = list(exit_bb.instructions)
+            entry_instrs = entry.instructions
+            exit_instrs = exit_bb.instructions
             assert len(entry_instrs) == 2
             assert entry_instrs[0] == a
             assert entry_instrs[1].opcode_name == "br"
@@ -76,7 +76,7 @@ def test_instruction_aliases_and_movement():
             assert b.parent == exit_bb
 
             b.move_after(x)
-            exit_instrs = list(exit_bb.instructions)
+            exit_instrs = exit_bb.instructions
             assert exit_instrs[0] == x
             assert exit_instrs[1] == b
             assert exit_instrs[2].opcode_name == "ret"
@@ -89,7 +89,7 @@ def test_instruction_aliases_and_movement():
             except Exception as e:
                 assert "terminator" in str(e).lower(), f"Unexpected error: {e}"
 
-            assert mod.verify(), mod.get_verification_error()
+            mod.verify_or_raise()
 
 
 def test_instruction_move_rejects_cross_context():
@@ -184,7 +184,7 @@ def test_instruction_move_rejects_invalid_placement():
                     f"Unexpected error: {e}"
                 )
 
-            assert m.verify(), m.get_verification_error()
+            m.verify_or_raise()
 
 
 def test_landingpad_move_rejected_and_ir_unchanged():
@@ -244,7 +244,7 @@ def test_landingpad_move_rejected_and_ir_unchanged():
                 f"Block mutated on failed move: {unwind_before} -> {unwind_after}"
             )
             assert after == before, "Module IR changed after rejected move"
-            assert m.verify(), m.get_verification_error()
+            m.verify_or_raise()
 
 
 if __name__ == "__main__":
@@ -5,39 +5,22 @@ improper cleanup order of LLVM objects.
 These tests verify that:
 1. Modules outliving their context don't crash the interpreter
 2. Proper exceptions are raised when accessing invalid objects
-3. Warning messages are emitted for memory leaks
+3. ResourceWarnings are emitted for memory leaks
 """
 
 import gc
-import io
-import os
-import sys
-import tempfile
+import warnings
 
 import llvm
 
 
-def create_test_bitcode():
-    """Create a simple bitcode file for testing."""
-    ir = """; ModuleID = 'test'
-source_filename = "test"
-
-define i32 @foo() {
-entry:
-  ret i32 42
-}
-"""
-    # Create temp .ll file
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ll", delete=False) as f:
-        f.write(ir)
-        ll_file = f.name
-
-    # Compile to bitcode
-    bc_file = ll_file.replace(".ll", ".bc")
-    os.system(f"./llvm-bin llvm-as {ll_file} -o {bc_file}")
-    os.unlink(ll_file)
-
-    return bc_file
+def assert_use_after_free(fn, what: str) -> None:
+    """Call fn and assert that it raises LLVMMemoryError."""
+    try:
+        fn()
+    except llvm.LLVMMemoryError:
+        return
+    raise AssertionError(f"Expected exception when accessing {what}")
 
 
 def test_module_outlives_context_no_crash():
@@ -87,10 +70,9 @@ def test_module_outlives_context_no_crash():
 
 def test_proper_cleanup_order():
     """Proper cleanup order should work without warnings or errors."""
-    old_stderr = sys.stderr
-    sys.stderr = io.StringIO()
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
 
-    try:
         with llvm.create_context() as ctx:
             with ctx.create_module("test") as m:
                 fn_ty = ctx.types.function(ctx.types.i32, [], False)
@@ -108,17 +90,34 @@ def test_proper_cleanup_order():
         # Context disposed here (end of 'with llvm.create_context')
 
         gc.collect()
-        stderr_output = sys.stderr.getvalue()
-    finally:
-        sys.stderr = old_stderr
 
-    # With proper cleanup, there should be no warnings
-    assert "Warning" not in stderr_output, (
-        f"Unexpected warning with proper cleanup: {stderr_output}"
-    )
+    # With proper cleanup, there should be no leak warnings
+    leaks = [w for w in caught if issubclass(w.category, ResourceWarning)]
+    assert not leaks, f"Unexpected warning with proper cleanup: {leaks[0].message}"
     print("  (proper cleanup produced no warnings)")
 
 
+def test_module_outlives_context_warns():
+    """A module leaked past its context should raise a ResourceWarning."""
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+
+        with llvm.create_context() as ctx:
+            # Enter the manager by hand and never exit it, so the module
+            # wrapper is still alive when the context goes away
+            leaked_mgr = ctx.create_module("leaked")
+            leaked_mod = leaked_mgr.__enter__()
+
+        del leaked_mod
+        del leaked_mgr
+        gc.collect()
+
+    leaks = [w for w in caught if issubclass(w.category, ResourceWarning)]
+    assert leaks, "Expected a ResourceWarning for a module outliving its context"
+    assert "outlived its Context" in str(leaks[0].message)
+    print("  (leaked module produced a ResourceWarning)")
+
+
 def test_value_outlives_context():
     """Values outliving their context should raise exceptions, not crash."""
     escaped_value = None
@@ -127,18 +126,14 @@ def test_value_outlives_context():
         escaped_value = ctx.types.i32.constant(123, False)
         # Value is valid here
         assert escaped_value.is_constant
+        assert escaped_value.is_valid
 
     # Context destroyed, value should be invalid
     gc.collect()
+    assert not escaped_value.is_valid
 
-    exception_raised = False
-    try:
-        _ = escaped_value.is_constant
-    except llvm.LLVMMemoryError:
-        exception_raised = True
-
-    assert exception_raised, (
-        "Expected exception when accessing value after context destroyed"
+    assert_use_after_free(
+        lambda: escaped_value.is_constant, "value after context destroyed"
     )
     print("  (value outlived context, got expected exception)")
 
@@ -151,18 +146,14 @@ def test_type_outlives_context():
         escaped_type = ctx.types.i32
         # Type is valid here
         assert escaped_type.is_integer
+        assert escaped_type.is_valid
 
     # Context destroyed, type should be invalid
     gc.collect()
+    assert not escaped_type.is_valid
 
-    exception_raised = False
-    try:
-        _ = escaped_type.is_integer
-    except llvm.LLVMMemoryError:
-        exception_raised = True
-
-    assert exception_raised, (
-        "Expected exception when accessing type after context destroyed"
+    assert_use_after_free(
+        lambda: escaped_type.is_integer, "type after context destroyed"
     )
     print("  (type outlived context, got expected exception)")
 
@@ -211,15 +202,7 @@ def test_function_outlives_module():
     # Context also disposed
     gc.collect()
 
-    exception_raised = False
-    try:
-        _ = escaped_fn.name
-    except llvm.LLVMMemoryError:
-        exception_raised = True
-
-    assert exception_raised, (
-        "Expected exception when accessing function after module destroyed"
-    )
+    assert_use_after_free(lambda: escaped_fn.name, "function after module destroyed")
     print("  (function outlived module, got expected exception)")
 
 
@@ -234,19 +217,13 @@ def test_basic_block_outlives_function():
             escaped_bb = fn.append_basic_block("entry")
             # BB is valid here
             assert escaped_bb.name == "entry"
+            assert escaped_bb.is_valid
 
     # Everything disposed
     gc.collect()
+    assert not escaped_bb.is_valid
 
-    exception_raised = False
-    try:
-        _ = escaped_bb.name
-    except llvm.LLVMMemoryError:
-        exception_raised = True
-
-    assert exception_raised, (
-        "Expected exception when accessing BB after context destroyed"
-    )
+    assert_use_after_free(lambda: escaped_bb.name, "BB after context destroyed")
     print("  (basic block outlived context, got expected exception)")
 
 
@@ -255,6 +232,7 @@ if __name__ == "__main__":
     print()
 
     test_proper_cleanup_order()
+    test_module_outlives_context_warns()
     test_value_outlives_context()
     test_type_outlives_context()
     test_function_outlives_module()
@@ -30,7 +30,7 @@ def test_split_basic_block():
             new_bb = entry.split_basic_block(split_point, "split")
 
             # Original block should end with an unconditional branch.
-            entry_instrs = list(entry.instructions)
+            entry_instrs = entry.instructions
             assert entry_instrs[-1].opcode_name == "br", (
                 f"Expected 'br', got '{entry_instrs[-1].opcode_name}'"
             )
@@ -42,7 +42,7 @@ def test_split_basic_block():
             assert successors[0].name == "split"
 
             # New block should contain mul and ret.
-            new_instrs = list(new_bb.instructions)
+            new_instrs = new_bb.instructions
             opcodes = [i.opcode_name for i in new_instrs]
             assert "mul" in opcodes, f"Expected 'mul' in new block, got {opcodes}"
             assert "ret" in opcodes, f"Expected 'ret' in new block, got {opcodes}"
@@ -155,13 +155,13 @@ def test_split_basic_block_before():
             fn_blocks = [bb.name for bb in fn.basic_blocks]
             assert fn_blocks == ["entry_prefix", "entry"], fn_blocks
 
-            new_pred_instrs = list(new_pred.instructions)
+            new_pred_instrs = new_pred.instructions
             new_pred_ops = [inst.opcode_name for inst in new_pred_instrs]
             assert "add" in new_pred_ops, new_pred_ops
             assert "mul" not in new_pred_ops, new_pred_ops
             assert new_pred_ops[-1] == "br", new_pred_ops
 
-            entry_instrs = list(entry.instructions)
+            entry_instrs = entry.instructions
             entry_ops = [inst.opcode_name for inst in entry_instrs]
             assert "mul" in entry_ops, entry_ops
             assert "add" not in entry_ops, entry_ops
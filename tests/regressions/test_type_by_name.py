@@ -11,24 +11,22 @@ import llvm
 def test_get_type_by_name_nonexistent_returns_none():
     """get_type_by_name should return None for non-existent types."""
     with llvm.create_context() as ctx:
-        with ctx.create_module("test") as m:
-            # Looking up a non-existent type should return None
-            result = ctx.types.get("NonExistent")
-            assert result is None, f"Expected None, got {result!r}"
+        # Looking up a non-existent type should return None
+        result = ctx.types.get("NonExistent")
+        assert result is None, f"Expected None, got {result!r}"
 
 
 def test_get_type_by_name_existing_returns_type():
     """get_type_by_name should return the type when it exists."""
     with llvm.create_context() as ctx:
-        with ctx.create_module("test") as m:
-            # Create a named struct
-            struct = ctx.types.opaque_struct("MyStruct")
-            struct.set_body([ctx.types.i32], False)
-
-            # Looking up the existing type should return it
-            result = ctx.types.get("MyStruct")
-            assert result is not None, "Expected to find MyStruct"
-            assert result.struct_name == "MyStruct"
+        # Create a named struct
+        struct = ctx.types.opaque_struct("MyStruct")
+        struct.set_body([ctx.types.i32], False)
+
+        # Looking up the existing type should return it
+        result = ctx.types.get("MyStruct")
+        assert result is not None, "Expected to find MyStruct"
+        assert result.struct_name == "MyStruct"
 
 
 if __name__ == "__main__":
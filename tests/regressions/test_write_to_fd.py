@@ -0,0 +1,106 @@
+"""
+Regression tests for writing modules straight to file descriptors.
+
+Module.write_bitcode_to_fd and Module.write_to_fd bypass Python file
+objects. Their output must round-trip and match the in-memory variants
+(write_bitcode_to_memory_buffer / to_string).
+"""
+
+import os
+import tempfile
+import threading
+
+import llvm
+
+
+IR = """
+define i32 @add(i32 %a, i32 %b) {
+entry:
+  %sum = add i32 %a, %b
+  ret i32 %sum
+}
+"""
+
+
+def test_write_bitcode_to_fd_round_trips():
+    with llvm.create_context() as ctx:
+        with ctx.parse_ir(IR) as mod:
+            expected = mod.write_bitcode_to_memory_buffer()
+            with tempfile.TemporaryFile() as f:
+                mod.write_bitcode_to_fd(f.fileno())
+                f.seek(0)
+                bitcode = f.read()
+
+        assert bitcode == expected, "fd bitcode differs from memory buffer"
+        with ctx.parse_bitcode_from_bytes(bitcode) as parsed:
+            fn = parsed.get_function("add")
+            assert fn is not None, "Function 'add' lost in round trip"
+            assert fn.param_count == 2
+
+
+def test_write_to_fd_through_pipe():
+    with llvm.create_context() as ctx:
+        with ctx.parse_ir(IR) as mod:
+            expected = mod.to_string().encode()
+
+            read_fd, write_fd = os.pipe()
+            chunks: list[bytes] = []
+
+            def drain():
+                with os.fdopen(read_fd, "rb") as r:
+                    chunks.append(r.read())
+
+            reader = threading.Thread(target=drain)
+            reader.start()
+            try:
+                mod.write_to_fd(write_fd)
+            finally:
+                os.close(write_fd)
+                reader.join()
+
+            assert b"".join(chunks) == expected, "pipe output differs from to_string"
+
+
+def closed_fd() -> int:
+    read_fd, write_fd = os.pipe()
+    os.close(read_fd)
+    os.close(write_fd)
+    return write_fd
+
+
+def test_write_to_fd_reports_bad_descriptor():
+    write_fd = closed_fd()
+    with llvm.create_context() as ctx:
+        with ctx.parse_ir(IR) as mod:
+            try:
+                mod.write_to_fd(write_fd)
+            except llvm.LLVMError:
+                pass
+            else:
+                raise AssertionError("Expected llvm.LLVMError for a closed fd")
+
+
+def test_write_bitcode_to_fd_reports_bad_descriptor():
+    write_fd = closed_fd()
+    with llvm.create_context() as ctx:
+        with ctx.parse_ir(IR) as mod:
+            try:
+                mod.write_bitcode_to_fd(write_fd)
+            except llvm.LLVMError:
+                pass
+            else:
+                raise AssertionError("Expected llvm.LLVMError for a closed fd")
+
+
+if __name__ == "__main__":
+    test_write_bitcode_to_fd_round_trips()
+    print("test_write_bitcode_to_fd_round_trips: PASSED")
+
+    test_write_to_fd_through_pipe()
+    print("test_write_to_fd_through_pipe: PASSED")
+
+    test_write_to_fd_reports_bad_descriptor()
+    print("test_write_to_fd_reports_bad_descriptor: PASSED")
+
+    test_write_bitcode_to_fd_reports_bad_descriptor()
+    print("test_write_bitcode_to_fd_reports_bad_descriptor: PASSED")
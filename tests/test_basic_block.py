@@ -7,10 +7,10 @@ This is the Python equivalent of tests/test_basic_block.cpp.
 Output should match the C++ golden master test.
 
 LLVM APIs covered (via Python bindings):
-- append_basic_block()
+- append_basic_block(), append_basic_blocks()
 - name property
 - parent property
-- entry_block, basic_block_count
+- entry_block, basic_block_count, basic_block_names
 - first_basic_block, next_block, last_basic_block
 - first_instruction, last_instruction, terminator
 - move_before(), move_after()
@@ -32,9 +32,9 @@ def main():
             func = mod.add_function("test_func", func_ty)
 
             # Append basic blocks
-            entry = func.append_basic_block("entry")
-            middle = func.append_basic_block("middle")
-            exit_bb = func.append_basic_block("exit")
+            entry, middle, exit_bb = func.append_basic_blocks(
+                ["entry", "middle", "exit"]
+            )
 
             # Get block names
             entry_name = entry.name
@@ -90,52 +90,45 @@ def main():
                 )
                 return 1
 
-            # Print diagnostic comments
-            print("; Test: test_basic_block")
-            print(";")
-            print("; Basic block info:")
-            print(f";   entry name: {entry_name}")
-            print(f";   middle name: {middle_name}")
-            print(f";   exit name: {exit_name}")
-            print(";")
-            print("; Parent checks:")
-            # Compare by name since we can't compare object identity directly
-            print(
-                f";   entry parent is func: {'yes' if entry_parent.name == func.name else 'no'}"
-            )
-            print(
-                f";   func entry block is entry: {'yes' if func_entry.name == entry.name else 'no'}"
-            )
-            print(";")
-            print("; Block counts:")
-            print(f";   initial count: {bb_count}")
-            print(f";   after adding unattached: {bb_count_after}")
-            print(";")
-            print("; Instruction checks:")
-            print(
-                f";   entry has first instruction: {'yes' if entry_first is not None else 'no'}"
-            )
-            print(
-                f";   entry first == last (single inst): {'yes' if entry_first is not None and entry_last is not None else 'no'}"
-            )
-            print(
-                f";   exit has terminator: {'yes' if exit_terminator is not None else 'no'}"
-            )
-            print(";")
-            print("; Block iteration (after move):")
-            for i, bb in enumerate(func.basic_blocks):
-                print(f";   [{i}] {bb.name}")
-
             # Get last block
             last_bb = func.last_basic_block
             assert last_bb is not None
-            print(";")
-            print(f"; Last block: {last_bb.name}")
 
-            print()
-
-            # Print module IR
-            print(mod.to_string(), end="")
+            # Print diagnostic comments, then stream module IR to stdout
+            lines = [
+                "; Test: test_basic_block",
+                ";",
+                "; Basic block info:",
+                f";   entry name: {entry_name}",
+                f";   middle name: {middle_name}",
+                f";   exit name: {exit_name}",
+                ";",
+                "; Parent checks:",
+                # Compare by name since we can't compare object identity directly
+                f";   entry parent is func: {'yes' if entry_parent.name == func.name else 'no'}",
+                f";   func entry block is entry: {'yes' if func_entry.name == entry.name else 'no'}",
+                ";",
+                "; Block counts:",
+                f";   initial count: {bb_count}",
+                f";   after adding unattached: {bb_count_after}",
+                ";",
+                "; Instruction checks:",
+                f";   entry has first instruction: {'yes' if entry_first is not None else 'no'}",
+                f";   entry first == last (single inst): {'yes' if entry_first is not None and entry_last is not None else 'no'}",
+                f";   exit has terminator: {'yes' if exit_terminator is not None else 'no'}",
+                ";",
+                "; Block iteration (after move):",
+            ]
+            lines.extend(
+                f";   [{i}] {name}" for i, name in enumerate(func.basic_block_names)
+            )
+            lines += [
+                ";",
+                f"; Last block: {last_bb.name}",
+                "",
+            ]
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.write(mod.to_string())
 
     return 0
 
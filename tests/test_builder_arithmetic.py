@@ -7,15 +7,18 @@ Python equivalent of tests/test_builder_arithmetic.cpp
 Must produce identical output to the C++ version.
 """
 
+import sys
+
 import llvm
 
 
 def main():
     with llvm.create_context() as ctx:
         with ctx.create_module("test_builder_arithmetic") as mod:
-            i32 = ctx.types.i32
-            i64 = ctx.types.i64
-            f64 = ctx.types.f64
+            types = ctx.types.common()
+            i32 = types.i32
+            i64 = types.i64
+            f64 = types.f64
 
             # Integer arithmetic function: i32 int_arith(i32, i32)
             int_func_ty = ctx.types.function(i32, [i32, i32])
@@ -27,6 +30,19 @@ def main():
             b.name = "b"
 
             int_entry = int_func.append_basic_block("entry")
+
+            # Floating point arithmetic function: f64 float_arith(f64, f64)
+            fp_func_ty = ctx.types.function(f64, [f64, f64])
+            fp_func = mod.add_function("float_arith", fp_func_ty)
+
+            x = fp_func.get_param(0)
+            y = fp_func.get_param(1)
+            x.name = "x"
+            y.name = "y"
+
+            fp_entry = fp_func.append_basic_block("entry")
+
+            # One builder for both functions, repositioned between bodies
             with int_entry.create_builder() as builder:
                 # Basic arithmetic
                 add = builder.add(a, b, "add")
@@ -64,18 +80,8 @@ def main():
                 # Return something to make function complete
                 builder.ret(add)
 
-            # Floating point arithmetic function: f64 float_arith(f64, f64)
-            fp_func_ty = ctx.types.function(f64, [f64, f64])
-            fp_func = mod.add_function("float_arith", fp_func_ty)
-
-            x = fp_func.get_param(0)
-            y = fp_func.get_param(1)
-            x.name = "x"
-            y.name = "y"
-
-            fp_entry = fp_func.append_basic_block("entry")
-            with fp_entry.create_builder() as builder:
-                # Floating point operations
+                # Floating point operations, reusing the same builder
+                builder.position_at_end(fp_entry)
                 fadd = builder.fadd(x, y, "fadd")
                 fsub = builder.fsub(x, y, "fsub")
                 fmul = builder.fmul(x, y, "fmul")
@@ -90,23 +96,22 @@ def main():
                 print(f"; Verification failed: {mod.get_verification_error()}")
                 return 1
 
-            # Print diagnostic comments
-            print("; Test: test_builder_arithmetic")
-            print(";")
-            print("; Integer operations demonstrated:")
-            print(";   add, sub, mul, sdiv, udiv, srem, urem")
-            print(
-                ";   nsw_add, nuw_add, nsw_sub, nuw_sub, nsw_mul, nuw_mul, exact_sdiv"
-            )
-            print(";   and, or, xor, shl, lshr, ashr")
-            print(";   neg, nsw_neg, not")
-            print(";")
-            print("; Floating point operations demonstrated:")
-            print(";   fadd, fsub, fmul, fdiv, frem, fneg")
-            print()
-
-            # Print module IR
-            print(mod.to_string(), end="")
+            # Print diagnostic comments, then stream module IR to stdout
+            lines = [
+                "; Test: test_builder_arithmetic",
+                ";",
+                "; Integer operations demonstrated:",
+                ";   add, sub, mul, sdiv, udiv, srem, urem",
+                ";   nsw_add, nuw_add, nsw_sub, nuw_sub, nsw_mul, nuw_mul, exact_sdiv",
+                ";   and, or, xor, shl, lshr, ashr",
+                ";   neg, nsw_neg, not",
+                ";",
+                "; Floating point operations demonstrated:",
+                ";   fadd, fsub, fmul, fdiv, frem, fneg",
+                "",
+            ]
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.write(mod.to_string())
 
     return 0
 
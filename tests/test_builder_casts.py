@@ -7,20 +7,23 @@ Python equivalent of tests/test_builder_casts.cpp
 Must produce identical output to the C++ version.
 """
 
+import sys
+
 import llvm
 
 
 def main():
     with llvm.create_context() as ctx:
         with ctx.create_module("test_builder_casts") as mod:
-            i8 = ctx.types.i8
-            i16 = ctx.types.i16
-            i32 = ctx.types.i32
-            i64 = ctx.types.i64
-            f32 = ctx.types.f32
-            f64 = ctx.types.f64
-            ptr = ctx.types.ptr
-            void_ty = ctx.types.void
+            types = ctx.types.common()
+            i8 = types.i8
+            i16 = types.i16
+            i32 = types.i32
+            i64 = types.i64
+            f32 = types.f32
+            f64 = types.f64
+            ptr = types.ptr
+            void_ty = types.void
 
             assert i8 == ctx.types.int_n(8), "oh nein"
 
@@ -143,19 +146,20 @@ def main():
                 print(f"; Verification failed: {mod.get_verification_error()}")
                 return 1
 
-            # Print diagnostic comments
-            print("; Test: test_builder_casts")
-            print(";")
-            print("; Cast operations demonstrated:")
-            print(";   Integer: trunc, zext, sext, intcast2")
-            print(";   Float: fptrunc, fpext")
-            print(";   Int<->Float: uitofp, sitofp, fptoui, fptosi")
-            print(";   Pointer: ptrtoint, inttoptr")
-            print(";   Reinterpret: bitcast")
-            print()
-
-            # Print module IR
-            print(mod.to_string(), end="")
+            # Print diagnostic comments, then stream module IR to stdout
+            lines = [
+                "; Test: test_builder_casts",
+                ";",
+                "; Cast operations demonstrated:",
+                ";   Integer: trunc, zext, sext, intcast2",
+                ";   Float: fptrunc, fpext",
+                ";   Int<->Float: uitofp, sitofp, fptoui, fptosi",
+                ";   Pointer: ptrtoint, inttoptr",
+                ";   Reinterpret: bitcast",
+                "",
+            ]
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.write(mod.to_string())
 
     return 0
 
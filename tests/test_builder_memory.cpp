@@ -8,6 +8,7 @@
  * - LLVMBuildGEP2(), LLVMBuildInBoundsGEP2(), LLVMBuildStructGEP2()
  * - LLVMGetVolatile(), LLVMSetVolatile()
  * - LLVMGetAlignment(), LLVMSetAlignment()
+ * - LLVMConstNamedStruct() (aggregate store)
  */
 
 #include <cstdio>
@@ -92,16 +93,20 @@ int main() {
   LLVMValueRef struct_gep_2 =
       LLVMBuildStructGEP2(builder, struct_ty, struct_alloca, 2, "field_2");
 
-  // Store to struct fields
-  LLVMBuildStore(builder, LLVMConstInt(i32, 100, 0), struct_gep_0);
-  LLVMBuildStore(builder, LLVMConstInt(i64, 200, 0), struct_gep_1);
-  LLVMBuildStore(builder, LLVMConstInt(i32, 300, 0), struct_gep_2);
+  // Initialize all struct fields with a single aggregate store
+  LLVMValueRef struct_fields[] = {LLVMConstInt(i32, 100, 0),
+                                  LLVMConstInt(i64, 200, 0),
+                                  LLVMConstInt(i32, 300, 0)};
+  LLVMValueRef struct_init = LLVMConstNamedStruct(struct_ty, struct_fields, 3);
+  LLVMBuildStore(builder, struct_init, struct_alloca);
 
   // Load from struct fields
   LLVMValueRef field_0_val =
       LLVMBuildLoad2(builder, i32, struct_gep_0, "field_0_val");
   LLVMValueRef field_1_val =
       LLVMBuildLoad2(builder, i64, struct_gep_1, "field_1_val");
+  LLVMValueRef field_2_val =
+      LLVMBuildLoad2(builder, i32, struct_gep_2, "field_2_val");
 
   LLVMBuildRetVoid(builder);
 
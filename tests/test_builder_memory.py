@@ -7,16 +7,19 @@ Python equivalent of tests/test_builder_memory.cpp
 Must produce identical output to the C++ version.
 """
 
+import sys
+
 import llvm
 
 
 def main():
     with llvm.create_context() as ctx:
         with ctx.create_module("test_builder_memory") as mod:
-            i32 = ctx.types.i32
-            i64 = ctx.types.i64
-            ptr = ctx.types.ptr
-            void_ty = ctx.types.void
+            types = ctx.types.common()
+            i32 = types.i32
+            i64 = types.i64
+            ptr = types.ptr
+            void_ty = types.void
 
             # Array type for array alloca test
             arr_ty = i32.array(10)
@@ -63,7 +66,7 @@ def main():
                 aligned_load.set_inst_alignment(16)
 
                 # GEP into array (static)
-                indices = [i64.constant(0), i64.constant(3)]
+                indices = (i64.constant(0), i64.constant(3))
                 gep = builder.gep(arr_ty, static_array, indices, "arr_elem")
 
                 # Inbounds GEP
@@ -82,14 +85,16 @@ def main():
                     struct_ty, struct_alloca, 2, "field_2"
                 )
 
-                # Store to struct fields
-                builder.store(i32.constant(100), struct_gep_0)
-                builder.store(i64.constant(200), struct_gep_1)
-                builder.store(i32.constant(300), struct_gep_2)
+                # Initialize all struct fields with a single aggregate store
+                struct_init = struct_ty.const_named_struct(
+                    [i32.constant(100), i64.constant(200), i32.constant(300)]
+                )
+                builder.store(struct_init, struct_alloca)
 
                 # Load from struct fields
                 field_0_val = builder.load(i32, struct_gep_0, "field_0_val")
                 field_1_val = builder.load(i64, struct_gep_1, "field_1_val")
+                field_2_val = builder.load(i32, struct_gep_2, "field_2_val")
 
                 builder.ret_void()
 
@@ -98,36 +103,29 @@ def main():
                 print(f"; Verification failed: {mod.get_verification_error()}")
                 return 1
 
-            # Print diagnostic comments
-            print("; Test: test_builder_memory")
-            print(";")
-            print("; Memory operations demonstrated:")
-            print(
-                ";   alloca (i32, i64 with alignment, dynamic array, static array, struct)"
-            )
-            print(";   store (basic, volatile)")
-            print(";   load (basic, volatile, aligned)")
-            print(";   GEP (array indexing, inbounds)")
-            print(";   struct GEP (field access)")
-            print(";")
-            print("; Alignment checks:")
-            print(f";   alloca_aligned alignment: {alloca_aligned.inst_alignment}")
-            print(f";   aligned_load alignment: {aligned_load.inst_alignment}")
-            print(";")
-            print("; Volatile checks:")
-            print(
-                f";   volatile_store is volatile: {'yes' if volatile_store.is_volatile else 'no'}"
-            )
-            print(
-                f";   volatile_load is volatile: {'yes' if volatile_load.is_volatile else 'no'}"
-            )
-            print(
-                f";   regular store is volatile: {'yes' if store.is_volatile else 'no'}"
-            )
-            print()
-
-            # Print module IR
-            print(mod.to_string(), end="")
+            # Print diagnostic comments, then stream module IR to stdout
+            lines = [
+                "; Test: test_builder_memory",
+                ";",
+                "; Memory operations demonstrated:",
+                ";   alloca (i32, i64 with alignment, dynamic array, static array, struct)",
+                ";   store (basic, volatile)",
+                ";   load (basic, volatile, aligned)",
+                ";   GEP (array indexing, inbounds)",
+                ";   struct GEP (field access)",
+                ";",
+                "; Alignment checks:",
+                f";   alloca_aligned alignment: {alloca_aligned.inst_alignment}",
+                f";   aligned_load alignment: {aligned_load.inst_alignment}",
+                ";",
+                "; Volatile checks:",
+                f";   volatile_store is volatile: {'yes' if volatile_store.is_volatile else 'no'}",
+                f";   volatile_load is volatile: {'yes' if volatile_load.is_volatile else 'no'}",
+                f";   regular store is volatile: {'yes' if store.is_volatile else 'no'}",
+                "",
+            ]
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.write(mod.to_string())
 
     return 0
 
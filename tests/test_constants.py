@@ -7,6 +7,8 @@ Python equivalent of tests/test_constants.cpp
 Must produce identical output to the C++ version.
 """
 
+import sys
+
 import llvm
 
 
@@ -14,14 +16,15 @@ def main():
     with llvm.create_context() as ctx:
         with ctx.create_module("test_constants") as mod:
             # Types
-            i1 = ctx.types.i1
-            i8 = ctx.types.i8
-            i32 = ctx.types.i32
-            i64 = ctx.types.i64
+            types = ctx.types.common()
+            i1 = types.i1
+            i8 = types.i8
+            i32 = types.i32
+            i64 = types.i64
             i128 = ctx.types.i128
-            f32 = ctx.types.f32
-            f64 = ctx.types.f64
-            ptr = ctx.types.ptr
+            f32 = types.f32
+            f64 = types.f64
+            ptr = types.ptr
 
             # ==========================================
             # Integer constants
@@ -61,22 +64,17 @@ def main():
             # ==========================================
             # String constant
             # ==========================================
-            str_val = "Hello, LLVM!"
+            # bytes go straight to LLVM; str is UTF-8 encoded first
+            str_val = b"Hello, LLVM!"
             const_string = llvm.const_string(ctx, str_val, dont_null_terminate=False)
             const_string_no_null = llvm.const_string(
-                ctx, str_val, dont_null_terminate=True
+                ctx, str_val.decode(), dont_null_terminate=True
             )
 
             # ==========================================
             # Array constant
             # ==========================================
-            arr_elems = [
-                i32.constant(1),
-                i32.constant(2),
-                i32.constant(3),
-                i32.constant(4),
-                i32.constant(5),
-            ]
+            arr_elems = i32.constants([1, 2, 3, 4, 5])
             const_array = llvm.const_array(i32, arr_elems)
 
             # ==========================================
@@ -93,120 +91,78 @@ def main():
             # ==========================================
             # Named struct constant
             # ==========================================
-            named_struct_ty = ctx.types.opaque_struct("Point")
-            named_struct_ty.set_body([i32, i32], packed=False)
+            named_struct_ty = ctx.types.struct([i32, i32], packed=False, name="Point")
 
-            point_vals = [
-                i32.constant(10),
-                i32.constant(20),
-            ]
+            point_vals = i32.constants([10, 20])
             const_named_struct = llvm.const_named_struct(named_struct_ty, point_vals)
 
             # ==========================================
             # Vector constant
             # ==========================================
-            vec_elems = [
-                i32.constant(1),
-                i32.constant(2),
-                i32.constant(3),
-                i32.constant(4),
-            ]
+            vec_elems = i32.constants([1, 2, 3, 4])
             const_vector = llvm.const_vector(vec_elems)
 
             # ==========================================
             # Add globals to expose constants in output
             # ==========================================
-            g = mod.add_global(i32, "const_42")
-            g.initializer = const_42
-            g.set_constant(True)
-
-            g = mod.add_global(i32, "const_neg1")
-            g.initializer = const_neg1
-            g.set_constant(True)
-
-            g = mod.add_global(i64, "const_i64")
-            g.initializer = const_i64
-            g.set_constant(True)
-
-            g = mod.add_global(i128, "const_i128")
-            g.initializer = const_i128
-            g.set_constant(True)
-
-            g = mod.add_global(f64, "const_pi")
-            g.initializer = const_pi
-            g.set_constant(True)
-
-            g = mod.add_global(i32, "all_ones")
-            g.initializer = all_ones
-            g.set_constant(True)
-
-            g = mod.add_global(i32, "undef_val")
-            g.initializer = undef_i32
-
-            g = mod.add_global(i32, "poison_val")
-            g.initializer = poison_i32
+            mod.add_global(i32, "const_42", const_42, constant=True)
+            mod.add_global(i32, "const_neg1", const_neg1, constant=True)
+            mod.add_global(i64, "const_i64", const_i64, constant=True)
+            mod.add_global(i128, "const_i128", const_i128, constant=True)
+            mod.add_global(f64, "const_pi", const_pi, constant=True)
+            mod.add_global(i32, "all_ones", all_ones, constant=True)
+            mod.add_global(i32, "undef_val", undef_i32)
+            mod.add_global(i32, "poison_val", poison_i32)
 
             # Get array type for const_string
             str_arr_ty = i8.array(len(str_val) + 1)
-            g = mod.add_global(str_arr_ty, "hello_string")
-            g.initializer = const_string
-            g.set_constant(True)
+            mod.add_global(str_arr_ty, "hello_string", const_string, constant=True)
 
             arr_ty = i32.array(5)
-            g = mod.add_global(arr_ty, "const_array")
-            g.initializer = const_array
-            g.set_constant(True)
+            mod.add_global(arr_ty, "const_array", const_array, constant=True)
 
             # Struct type for global
             anon_struct_ty = ctx.types.struct([i32, f64, i64], packed=False)
-            g = mod.add_global(anon_struct_ty, "const_struct")
-            g.initializer = const_struct
-            g.set_constant(True)
-
-            g = mod.add_global(named_struct_ty, "const_point")
-            g.initializer = const_named_struct
-            g.set_constant(True)
+            mod.add_global(anon_struct_ty, "const_struct", const_struct, constant=True)
+            mod.add_global(
+                named_struct_ty, "const_point", const_named_struct, constant=True
+            )
 
             vec_ty = i32.vector(4)
-            g = mod.add_global(vec_ty, "const_vector")
-            g.initializer = const_vector
-            g.set_constant(True)
+            mod.add_global(vec_ty, "const_vector", const_vector, constant=True)
 
             # Verify module
             if not mod.verify():
                 print(f"; Verification failed: {mod.get_verification_error()}")
                 return 1
 
-            # Print diagnostic comments
-            print("; Test: test_constants")
-            print(";")
-            print("; Integer constants:")
-            print(f";   const_0 value (zext): {const_0.const_zext_value}")
-            print(f";   const_42 value (zext): {const_42.const_zext_value}")
-            print(f";   const_neg1 value (sext): {const_neg1.const_sext_value}")
-            print(f";   const_max_u32 value (zext): {const_max_u32.const_zext_value}")
-            print(";")
-            print("; Value checks:")
-            print(
-                f";   const_42 is constant: {'yes' if const_42.is_constant else 'no'}"
-            )
-            print(f";   null_i32 is null: {'yes' if null_i32.is_null else 'no'}")
-            print(f";   null_ptr is null: {'yes' if null_ptr.is_null else 'no'}")
-            print(f";   undef_i32 is undef: {'yes' if undef_i32.is_undef else 'no'}")
-            print(
-                f";   poison_i32 is poison: {'yes' if poison_i32.is_poison else 'no'}"
-            )
-            print(f";   const_42 is undef: {'yes' if const_42.is_undef else 'no'}")
-            print(";")
-            print("; Aggregate constants:")
-            print(";   array with 5 i32 elements")
-            print(";   struct with {i32, f64, i64}")
-            print(";   named struct Point with {i32, i32}")
-            print(";   vector with 4 x i32")
-            print()
-
-            # Print module IR
-            print(mod.to_string(), end="")
+            # Print diagnostic comments, then stream module IR to stdout
+            lines = [
+                "; Test: test_constants",
+                ";",
+                "; Integer constants:",
+                f";   const_0 value (zext): {const_0.const_zext_value}",
+                f";   const_42 value (zext): {const_42.const_zext_value}",
+                f";   const_neg1 value (sext): {const_neg1.const_sext_value}",
+                f";   const_max_u32 value (zext): {const_max_u32.const_zext_value}",
+                ";",
+                "; Value checks:",
+                f";   const_42 is constant: {'yes' if const_42.is_constant else 'no'}",
+                f";   null_i32 is null: {'yes' if null_i32.is_null else 'no'}",
+                f";   null_ptr is null: {'yes' if null_ptr.is_null else 'no'}",
+                f";   undef_i32 is undef: {'yes' if undef_i32.is_undef else 'no'}",
+                f";   poison_i32 is poison: {'yes' if poison_i32.is_poison else 'no'}",
+                f";   const_42 is undef: {'yes' if const_42.is_undef else 'no'}",
+                ";",
+                "; Aggregate constants:",
+                ";   array with 5 i32 elements",
+                ";   struct with {i32, f64, i64}",
+                ";   named struct Point with {i32, i32}",
+                ";   vector with 4 x i32",
+                "",
+            ]
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.write(mod.to_string())
 
     return 0
 
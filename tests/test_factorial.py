@@ -26,6 +26,7 @@ def main():
 
             i64 = ctx.types.i64
             i1 = ctx.types.i1
+            one = i64.constant(1)
 
             # ==========================================
             # Function: i64 factorial(i64 n)
@@ -38,18 +39,17 @@ def main():
             n.name = "n"
 
             # Basic blocks
-            entry = fact_func.append_basic_block("entry")
-            loop_cond = fact_func.append_basic_block("loop_cond")
-            loop_body = fact_func.append_basic_block("loop_body")
-            exit_bb = fact_func.append_basic_block("exit")
+            entry, loop_cond, loop_body, exit_bb = fact_func.append_basic_blocks(
+                ["entry", "loop_cond", "loop_body", "exit"]
+            )
 
             with entry.create_builder() as builder:
                 # Entry block: initialize result=1, i=1
                 result_ptr = builder.alloca(i64, "result")
                 i_ptr = builder.alloca(i64, "i")
 
-                builder.store(i64.constant(1), result_ptr)
-                builder.store(i64.constant(1), i_ptr)
+                builder.store(one, result_ptr)
+                builder.store(one, i_ptr)
                 builder.br(loop_cond)
 
                 # Loop condition: while (i <= n)
@@ -66,7 +66,7 @@ def main():
                 new_result = builder.mul(result_val, i_val2, "new_result")
                 builder.store(new_result, result_ptr)
 
-                new_i = builder.add(i_val2, i64.constant(1), "new_i")
+                new_i = builder.add(i_val2, one, "new_i")
                 builder.store(new_i, i_ptr)
 
                 builder.br(loop_cond)
@@ -84,24 +84,22 @@ def main():
                 n_rec = fact_rec_func.get_param(0)
                 n_rec.name = "n"
 
-                rec_entry = fact_rec_func.append_basic_block("entry")
-                base_case = fact_rec_func.append_basic_block("base_case")
-                recursive = fact_rec_func.append_basic_block("recursive")
+                rec_entry, base_case, recursive = fact_rec_func.append_basic_blocks(
+                    ["entry", "base_case", "recursive"]
+                )
 
                 # Entry: if n <= 1 goto base_case else goto recursive
                 builder.position_at_end(rec_entry)
-                is_base = builder.icmp(
-                    llvm.IntPredicate.SLE, n_rec, i64.constant(1), "is_base"
-                )
+                is_base = builder.icmp(llvm.IntPredicate.SLE, n_rec, one, "is_base")
                 builder.cond_br(is_base, base_case, recursive)
 
                 # Base case: return 1
                 builder.position_at_end(base_case)
-                builder.ret(i64.constant(1))
+                builder.ret(one)
 
                 # Recursive: return n * factorial_recursive(n-1)
                 builder.position_at_end(recursive)
-                n_minus_1 = builder.sub(n_rec, i64.constant(1), "n_minus_1")
+                n_minus_1 = builder.sub(n_rec, one, "n_minus_1")
                 rec_result = builder.call(
                     fact_ty, fact_rec_func, [n_minus_1], "rec_result"
                 )
@@ -148,13 +146,11 @@ def main():
             print(";")
             print("; Function info:")
 
-            # Print function info
-            for func_name in ["factorial", "factorial_recursive", "main"]:
-                func = mod.get_function(func_name)
-                if func:
-                    print(
-                        f";   {func.name}: {func.param_count} params, {func.basic_block_count} blocks"
-                    )
+            # Print function info, walking the module like the C++ test does
+            for func in mod.functions:
+                print(
+                    f";   {func.name}: {func.param_count} params, {func.basic_block_count} blocks"
+                )
 
             print()
 
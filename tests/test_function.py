@@ -20,24 +20,6 @@ import sys
 import llvm
 
 
-def linkage_name(linkage: llvm.Linkage) -> str:
-    """Convert Linkage enum to the string name used in C++ test."""
-    mapping = {
-        llvm.Linkage.External: "external",
-        llvm.Linkage.AvailableExternally: "available_externally",
-        llvm.Linkage.LinkOnceAny: "linkonce",
-        llvm.Linkage.LinkOnceODR: "linkonce_odr",
-        llvm.Linkage.WeakAny: "weak",
-        llvm.Linkage.WeakODR: "weak_odr",
-        llvm.Linkage.Appending: "appending",
-        llvm.Linkage.Internal: "internal",
-        llvm.Linkage.Private: "private",
-        llvm.Linkage.ExternalWeak: "extern_weak",
-        llvm.Linkage.Common: "common",
-    }
-    return mapping.get(linkage, "unknown")
-
-
 def main():
     with llvm.create_context() as ctx:
         with ctx.create_module("test_function") as mod:
@@ -112,7 +94,7 @@ def main():
             print("; Function 'foo':")
             print(f";   name: {foo.name}")
             print(f";   param count: {foo.param_count}")
-            print(f";   linkage: {linkage_name(foo.linkage)}")
+            print(f";   linkage: {foo.linkage}")
             print(f";   calling conv: {foo.calling_conv.value} (C=0)")
 
             # bar info
@@ -130,7 +112,7 @@ def main():
             print(";")
             print("; Function 'baz':")
             print(f";   param count: {baz.param_count}")
-            print(f";   linkage: {linkage_name(baz.linkage)}")
+            print(f";   linkage: {baz.linkage}")
 
             # printf info
             print(";")
@@ -60,25 +60,22 @@ def main():
                 )
                 return 1
 
-            # Print diagnostic comments
-            print("; Test: test_module")
-            print(f"; Initial module ID: {initial_id}")
-            print(f"; New module ID: {new_id}")
-            print(f"; Initial source filename: {initial_src}")
-            print(f"; New source filename: {new_src}")
-            print(
-                f"; Initial data layout: {initial_layout if initial_layout else '(empty)'}"
-            )
-            print(f"; New data layout: {new_layout}")
-            print(
-                f"; Initial target: {initial_target if initial_target else '(empty)'}"
-            )
-            print(f"; New target: {new_target}")
-            print(f"; Cloned module ID: {cloned_id}")
-            print()
-
-            # Print module IR
-            print(mod.to_string(), end="")
+            # Print diagnostic comments, then stream module IR to stdout
+            lines = [
+                "; Test: test_module",
+                f"; Initial module ID: {initial_id}",
+                f"; New module ID: {new_id}",
+                f"; Initial source filename: {initial_src}",
+                f"; New source filename: {new_src}",
+                f"; Initial data layout: {initial_layout or '(empty)'}",
+                f"; New data layout: {new_layout}",
+                f"; Initial target: {initial_target or '(empty)'}",
+                f"; New target: {new_target}",
+                f"; Cloned module ID: {cloned_id}",
+                "",
+            ]
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.write(mod.to_string())
 
     return 0
 
@@ -7,15 +7,18 @@ Python equivalent of tests/test_struct.cpp
 Must produce identical output to the C++ version.
 """
 
+import sys
+
 import llvm
 
 
 def main():
     with llvm.create_context() as ctx:
         with ctx.create_module("test_struct") as mod:
-            i32 = ctx.types.i32
-            void_ty = ctx.types.void
-            ptr = ctx.types.ptr
+            types = ctx.types.common()
+            i32 = types.i32
+            void_ty = types.void
+            ptr = types.ptr
 
             # ==========================================
             # Define Point struct: { i32 x, i32 y }
@@ -77,9 +80,13 @@ def main():
                 b_x = builder.load(i32, b_x_ptr, "b_x")
                 b_y = builder.load(i32, b_y_ptr, "b_y")
 
-                # Compute sum
-                sum_x = builder.add(a_x, b_x, "sum_x")
-                sum_y = builder.add(a_y, b_y, "sum_y")
+                # Compute sum (independent adds, built in one batched call)
+                sum_x, sum_y = builder.binops(
+                    [
+                        (llvm.Opcode.Add, a_x, b_x, "sum_x"),
+                        (llvm.Opcode.Add, a_y, b_y, "sum_y"),
+                    ]
+                )
 
                 # Store to result
                 result_x_ptr = builder.struct_gep(point_ty, result, 0, "result_x_ptr")
@@ -125,11 +132,11 @@ def main():
                 p3 = builder.alloca(point_ty, "p3")
 
                 # Initialize p1 = (3, 4)
-                init_args1 = [p1, i32.constant(3), i32.constant(4)]
+                init_args1 = [p1, *i32.constants([3, 4])]
                 builder.call(init_ty, init_func, init_args1, "")
 
                 # Initialize p2 = (1, 2)
-                init_args2 = [p2, i32.constant(1), i32.constant(2)]
+                init_args2 = [p2, *i32.constants([1, 2])]
                 builder.call(init_ty, init_func, init_args2, "")
 
                 # Add p1 + p2 -> p3
@@ -145,7 +152,7 @@ def main():
             # ==========================================
             # Global constant Point
             # ==========================================
-            origin_vals = [i32.constant(0), i32.constant(0)]
+            origin_vals = i32.constants([0, 0])
             origin_const = llvm.const_named_struct(point_ty, origin_vals)
             origin_global = mod.add_global(point_ty, "origin")
             origin_global.initializer = origin_const
@@ -156,34 +163,35 @@ def main():
                 print(f"; Verification failed: {mod.get_verification_error()}")
                 return 1
 
-            # Print diagnostic comments
-            print("; Test: test_struct")
-            print("; Integration test: Point struct manipulation")
-            print(";")
-            print("; Struct definition:")
-            print(";   %Point = type { i32, i32 }  ; x, y fields")
-            print(";")
-            print("; Functions:")
-            print(";   point_init(Point*, i32, i32) -> void")
-            print(";   point_add(Point*, Point*, Point*) -> void")
-            print(";   point_manhattan(Point*) -> i32")
-            print(";   test_points() -> i32")
-            print(";")
-            print("; test_points creates:")
-            print(";   p1 = (3, 4)")
-            print(";   p2 = (1, 2)")
-            print(";   p3 = p1 + p2 = (4, 6)")
-            print(";   returns manhattan(p3) = 4 + 6 = 10")
-            print(";")
-            print("; Struct type info:")
-            print(f";   name: {point_ty.struct_name}")
-            print(f";   num elements: {point_ty.struct_element_count}")
-            print(f";   is packed: {'yes' if point_ty.is_packed_struct else 'no'}")
-            print(f";   is opaque: {'yes' if point_ty.is_opaque_struct else 'no'}")
-            print()
-
-            # Print module IR
-            print(mod.to_string(), end="")
+            # Print diagnostic comments, then stream module IR to stdout
+            lines = [
+                "; Test: test_struct",
+                "; Integration test: Point struct manipulation",
+                ";",
+                "; Struct definition:",
+                ";   %Point = type { i32, i32 }  ; x, y fields",
+                ";",
+                "; Functions:",
+                ";   point_init(Point*, i32, i32) -> void",
+                ";   point_add(Point*, Point*, Point*) -> void",
+                ";   point_manhattan(Point*) -> i32",
+                ";   test_points() -> i32",
+                ";",
+                "; test_points creates:",
+                ";   p1 = (3, 4)",
+                ";   p2 = (1, 2)",
+                ";   p3 = p1 + p2 = (4, 6)",
+                ";   returns manhattan(p3) = 4 + 6 = 10",
+                ";",
+                "; Struct type info:",
+                f";   name: {point_ty.struct_name}",
+                f";   num elements: {point_ty.struct_element_count}",
+                f";   is packed: {'yes' if point_ty.is_packed_struct else 'no'}",
+                f";   is opaque: {'yes' if point_ty.is_opaque_struct else 'no'}",
+                "",
+            ]
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.write(mod.to_string())
 
     return 0
 
@@ -18,27 +18,30 @@ import sys
 import llvm
 
 
+# TypeKind -> string name used in the C++ test
+TYPE_KIND_NAMES = {
+    llvm.TypeKind.Void: "void",
+    llvm.TypeKind.Half: "half",
+    llvm.TypeKind.Float: "float",
+    llvm.TypeKind.Double: "double",
+    llvm.TypeKind.FP128: "fp128",
+    llvm.TypeKind.Label: "label",
+    llvm.TypeKind.Integer: "integer",
+    llvm.TypeKind.Function: "function",
+    llvm.TypeKind.Struct: "struct",
+    llvm.TypeKind.Array: "array",
+    llvm.TypeKind.Pointer: "pointer",
+    llvm.TypeKind.Vector: "vector",
+    llvm.TypeKind.Metadata: "metadata",
+    llvm.TypeKind.Token: "token",
+    llvm.TypeKind.ScalableVector: "scalable_vector",
+    llvm.TypeKind.BFloat: "bfloat",
+}
+
+
 def type_kind_name(kind: llvm.TypeKind) -> str:
     """Convert TypeKind enum to the string name used in C++ test."""
-    mapping = {
-        llvm.TypeKind.Void: "void",
-        llvm.TypeKind.Half: "half",
-        llvm.TypeKind.Float: "float",
-        llvm.TypeKind.Double: "double",
-        llvm.TypeKind.FP128: "fp128",
-        llvm.TypeKind.Label: "label",
-        llvm.TypeKind.Integer: "integer",
-        llvm.TypeKind.Function: "function",
-        llvm.TypeKind.Struct: "struct",
-        llvm.TypeKind.Array: "array",
-        llvm.TypeKind.Pointer: "pointer",
-        llvm.TypeKind.Vector: "vector",
-        llvm.TypeKind.Metadata: "metadata",
-        llvm.TypeKind.Token: "token",
-        llvm.TypeKind.ScalableVector: "scalable_vector",
-        llvm.TypeKind.BFloat: "bfloat",
-    }
-    return mapping.get(kind, "unknown")
+    return TYPE_KIND_NAMES.get(kind, "unknown")
 
 
 def main():
@@ -110,74 +113,46 @@ def main():
                 )
                 return 1
 
-            # Print diagnostic comments
-            print("; Test: test_types")
-            print(";")
-            print("; Integer types:")
-            print(f";   i1 width: {i1.int_width}, kind: {type_kind_name(i1.kind)}")
-            print(f";   i8 width: {i8.int_width}, kind: {type_kind_name(i8.kind)}")
-            print(f";   i16 width: {i16.int_width}, kind: {type_kind_name(i16.kind)}")
-            print(f";   i32 width: {i32.int_width}, kind: {type_kind_name(i32.kind)}")
-            print(f";   i64 width: {i64.int_width}, kind: {type_kind_name(i64.kind)}")
-            print(
-                f";   i128 width: {i128.int_width}, kind: {type_kind_name(i128.kind)}"
-            )
-            print(
-                f";   i256 width: {i256.int_width}, kind: {type_kind_name(i256.kind)}"
-            )
-            print(";")
-            print("; Floating point types:")
-            print(f";   half kind: {type_kind_name(f16.kind)}")
-            print(f";   bfloat kind: {type_kind_name(bf16.kind)}")
-            print(f";   float kind: {type_kind_name(f32.kind)}")
-            print(f";   double kind: {type_kind_name(f64.kind)}")
-            print(";")
-            print("; Other types:")
-            print(
-                f";   void kind: {type_kind_name(void_ty.kind)}, sized: {'yes' if void_ty.is_sized else 'no'}"
-            )
-            print(
-                f";   pointer kind: {type_kind_name(ptr.kind)}, sized: {'yes' if ptr.is_sized else 'no'}"
-            )
-            print(
-                f";   array kind: {type_kind_name(arr_i32_10.kind)}, sized: {'yes' if arr_i32_10.is_sized else 'no'}"
-            )
-            print(
-                f";   vector kind: {type_kind_name(vec_i32_4.kind)}, sized: {'yes' if vec_i32_4.is_sized else 'no'}"
-            )
-            print(
-                f";   function kind: {type_kind_name(func_ty.kind)}, sized: {'yes' if func_ty.is_sized else 'no'}"
-            )
-            print(";")
-            print("; Struct types:")
-            print(
-                f";   anon_struct kind: {type_kind_name(anon_struct.kind)}, packed: {'yes' if anon_struct.is_packed_struct else 'no'}"
-            )
-            print(
-                f";   packed_struct kind: {type_kind_name(packed_struct.kind)}, packed: {'yes' if packed_struct.is_packed_struct else 'no'}"
-            )
-
-            named_struct_name = named_struct.struct_name
-            print(
-                f";   named_struct name: {named_struct_name}, opaque: {'yes' if named_struct.is_opaque_struct else 'no'}"
-            )
-
-            opaque_struct_name = opaque_struct.struct_name
-            print(
-                f";   opaque_struct name: {opaque_struct_name}, opaque: {'yes' if opaque_struct.is_opaque_struct else 'no'}"
-            )
-
-            # Print type strings
-            print(";")
-            print("; Type strings:")
-            print(f";   i32: {i32}")
-            print(f";   [10 x i32]: {arr_i32_10}")
-            print(f";   func type: {func_ty}")
-
-            print()
-
-            # Print module IR
-            print(mod.to_string(), end="")
+            # Print diagnostic comments, then stream module IR to stdout
+            lines = [
+                "; Test: test_types",
+                ";",
+                "; Integer types:",
+                f";   i1 width: {i1.int_width}, kind: {type_kind_name(i1.kind)}",
+                f";   i8 width: {i8.int_width}, kind: {type_kind_name(i8.kind)}",
+                f";   i16 width: {i16.int_width}, kind: {type_kind_name(i16.kind)}",
+                f";   i32 width: {i32.int_width}, kind: {type_kind_name(i32.kind)}",
+                f";   i64 width: {i64.int_width}, kind: {type_kind_name(i64.kind)}",
+                f";   i128 width: {i128.int_width}, kind: {type_kind_name(i128.kind)}",
+                f";   i256 width: {i256.int_width}, kind: {type_kind_name(i256.kind)}",
+                ";",
+                "; Floating point types:",
+                f";   half kind: {type_kind_name(f16.kind)}",
+                f";   bfloat kind: {type_kind_name(bf16.kind)}",
+                f";   float kind: {type_kind_name(f32.kind)}",
+                f";   double kind: {type_kind_name(f64.kind)}",
+                ";",
+                "; Other types:",
+                f";   void kind: {type_kind_name(void_ty.kind)}, sized: {'yes' if void_ty.is_sized else 'no'}",
+                f";   pointer kind: {type_kind_name(ptr.kind)}, sized: {'yes' if ptr.is_sized else 'no'}",
+                f";   array kind: {type_kind_name(arr_i32_10.kind)}, sized: {'yes' if arr_i32_10.is_sized else 'no'}",
+                f";   vector kind: {type_kind_name(vec_i32_4.kind)}, sized: {'yes' if vec_i32_4.is_sized else 'no'}",
+                f";   function kind: {type_kind_name(func_ty.kind)}, sized: {'yes' if func_ty.is_sized else 'no'}",
+                ";",
+                "; Struct types:",
+                f";   anon_struct kind: {type_kind_name(anon_struct.kind)}, packed: {'yes' if anon_struct.is_packed_struct else 'no'}",
+                f";   packed_struct kind: {type_kind_name(packed_struct.kind)}, packed: {'yes' if packed_struct.is_packed_struct else 'no'}",
+                f";   named_struct name: {named_struct.struct_name}, opaque: {'yes' if named_struct.is_opaque_struct else 'no'}",
+                f";   opaque_struct name: {opaque_struct.struct_name}, opaque: {'yes' if opaque_struct.is_opaque_struct else 'no'}",
+                ";",
+                "; Type strings:",
+                f";   i32: {i32}",
+                f";   [10 x i32]: {arr_i32_10}",
+                f";   func type: {func_ty}",
+                "",
+            ]
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.write(mod.to_string())
 
     return 0
 